@@ -5,6 +5,9 @@ Secrets (tokens) are taken from environment variables or from files
 repo.
 """
 
+import hashlib
+import os
+import re
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +15,11 @@ import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def _read_secret(env_key: str, file_env_key: str) -> str | None:
     """Read secret from env var or from file path in env (e.g. Docker
@@ -28,6 +36,12 @@ def _read_secret(env_key: str, file_env_key: str) -> str | None:
 # Injected by load_config so validators can read env/file
 _current_env: dict[str, str] = {}
 
+# Parsed configs keyed by (resolved path, mtime_ns, size) and by blake2b digest of
+# the file bytes (survives touch/re-save without changes); each entry keeps the
+# env snapshot it was built with, since BaseSettings models also read env vars
+_config_cache: dict[tuple[str, int, int], tuple[dict[str, str], "AppConfig"]] = {}
+_config_by_digest: dict[str, tuple[dict[str, str], "AppConfig"]] = {}
+
 
 class BotConfig(BaseSettings):
     """Bot identity and target repo."""
@@ -169,21 +183,40 @@ class AppConfig(BaseSettings):
         return _read_secret("CURSOR_AGENT_TOKEN", "CURSOR_AGENT_TOKEN_FILE")
 
 
+# Whole-string ${VAR} or $VAR reference
+_ENV_REF_RE = re.compile(r"\$\{(.*)\}|\$(.*)", re.DOTALL)
+
+
 def _substitute_env(value: Any) -> Any:
-    """Replace ${VAR} and $VAR in strings with os.environ."""
+    """Replace ${VAR} and $VAR in strings with os.environ.
+
+    Containers are copied only when something inside them changed;
+    otherwise the original object is returned.
+    """
     if isinstance(value, str):
-        if value.startswith("${") and value.endswith("}"):
-            key = value[2:-1].strip()
-            return _current_env.get(key, value)
-        # Simple $VAR
-        if value.startswith("$") and not value.startswith("${"):
-            key = value[1:].strip()
-            return _current_env.get(key, value)
-        return value
+        m = _ENV_REF_RE.fullmatch(value) if value.startswith("$") else None
+        if m is None:
+            return value
+        key = m.group(1) if m.group(1) is not None else m.group(2)
+        return _current_env.get(key.strip(), value)
     if isinstance(value, dict):
-        return {k: _substitute_env(v) for k, v in value.items()}
+        out: dict[Any, Any] | None = None
+        for k, v in value.items():
+            new_v = _substitute_env(v)
+            if new_v is not v:
+                if out is None:
+                    out = dict(value)
+                out[k] = new_v
+        return value if out is None else out
     if isinstance(value, list):
-        return [_substitute_env(v) for v in value]
+        out_list: list[Any] | None = None
+        for i, v in enumerate(value):
+            new_v = _substitute_env(v)
+            if new_v is not v:
+                if out_list is None:
+                    out_list = list(value)
+                out_list[i] = new_v
+        return value if out_list is None else out_list
     return value
 
 
@@ -191,9 +224,11 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     """Load config from YAML file and environment.
 
     Secrets: GITHUB_TOKEN or GITHUB_TOKEN_FILE, WEBHOOK_SECRET or WEBHOOK_SECRET_FILE.
+    Repeated calls for an unchanged file and environment reuse the parsed and
+    validated AppConfig; each caller gets its own deep copy, so mutating the
+    returned config never leaks into later load_config() calls.
     """
     global _current_env
-    import os
 
     _current_env = dict(os.environ)
 
@@ -201,7 +236,29 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     if not path.is_file():
         return AppConfig()
 
-    raw = yaml.safe_load(path.read_text()) or {}
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == _current_env:
+        return cached[1].model_copy(deep=True)
+
+    data = path.read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cached = _config_by_digest.get(digest)
+    if cached is not None and cached[0] == _current_env:
+        config = cached[1]
+    else:
+        config = _build_config(yaml.load(data, Loader=_SafeLoader) or {})
+        _config_by_digest.clear()
+        _config_by_digest[digest] = (_current_env, config)
+    _config_cache.clear()
+    _config_cache[key] = (_current_env, config)
+    return config.model_copy(deep=True)
+
+
+def _build_config(raw: dict[str, Any]) -> AppConfig:
+    """Build AppConfig from parsed YAML (env substitution and overrides
+    applied)."""
     raw = _substitute_env(raw)
 
     # Env overrides for nested values (e.g. BOT_REPOSITORY)
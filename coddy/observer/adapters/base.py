@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from coddy.observer.models import PR, Comment, Issue, ReviewComment
 
@@ -32,6 +32,15 @@ class GitPlatformAdapter(ABC):
         """Fetch comments on an issue."""
         ...
 
+    def fetch_issue_bundle(self, repo: str, issue_number: int) -> Tuple[Issue, List[Comment]]:
+        """Fetch an issue together with all its comments.
+
+        Default calls get_issue and get_issue_comments; platforms with a
+        batch API override this to do it in one request.
+        """
+        issue = self.get_issue(repo, issue_number)
+        return issue, self.get_issue_comments(repo, issue_number, since=None)
+
     @abstractmethod
     def create_comment(self, repo: str, issue_number: int, body: str) -> Comment:
         """Post a comment on an issue."""
@@ -1,22 +1,77 @@
 """GitHub API adapter."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from coddy.observer.adapters.base import GitPlatformAdapter, GitPlatformError
 from coddy.observer.models import PR, Comment, Issue, ReviewComment
 
+# GitHub maximum page size for list endpoints (default is 30)
+PER_PAGE = 100
+# Upper bound on concurrent page requests once the last page is known
+MAX_PAGE_WORKERS = 8
+# Keep-alive pool size; must cover MAX_PAGE_WORKERS plus concurrent callers
+POOL_MAXSIZE = 32
+# Max GET responses kept for If-None-Match revalidation (oldest evicted first)
+ETAG_CACHE_SIZE = 512
+# Methods safe to retry on transient server errors (idempotent)
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
 
+
+# Issue with labels and first page of comments in one GraphQL request
+_ISSUE_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      number title body state createdAt updatedAt
+      author { login }
+      labels(first: 100) { nodes { name } }
+      comments(first: 100) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId body createdAt updatedAt author { login } }
+      }
+    }
+  }
+}
+"""
+
+# Further pages of issue comments, for issues with more than 100
+_ISSUE_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $after: String!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      comments(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId body createdAt updatedAt author { login } }
+      }
+    }
+  }
+}
+"""
+
+
+@lru_cache(maxsize=4096)
 def _parse_iso(s: str) -> datetime:
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    # Python 3.11+ fromisoformat accepts the trailing "Z" directly
+    return datetime.fromisoformat(s)
+
+
+# The _*_from_api factories build models with model_construct: every field is
+# already normalized to its declared type here, so pydantic validation is skipped.
 
 
 def _issue_from_api(data: Dict[str, Any]) -> Issue:
     user = data.get("user") or {}
     labels = [lb["name"] for lb in (data.get("labels") or []) if isinstance(lb, dict) and "name" in lb]
-    return Issue(
+    return Issue.model_construct(
         number=data["number"],
         title=data.get("title") or "",
         body=data.get("body") or "",
@@ -32,7 +87,7 @@ def _comment_from_api(data: Dict[str, Any]) -> Comment:
     user = data.get("user") or {}
     created = _parse_iso(data["created_at"])
     updated = _parse_iso(data.get("updated_at") or data["created_at"])
-    return Comment(
+    return Comment.model_construct(
         id=data["id"],
         body=data.get("body") or "",
         author=user.get("login", ""),
@@ -41,10 +96,99 @@ def _comment_from_api(data: Dict[str, Any]) -> Comment:
     )
 
 
+def _issue_from_graphql(node: Dict[str, Any]) -> Issue:
+    """Build Issue from a GraphQL issue node (mapped to the REST field names)."""
+    return _issue_from_api(
+        {
+            "number": node["number"],
+            "title": node.get("title"),
+            "body": node.get("body"),
+            "state": (node.get("state") or "OPEN").lower(),
+            "user": node.get("author") or {},
+            "labels": (node.get("labels") or {}).get("nodes") or [],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+        }
+    )
+
+
+def _comment_from_graphql(node: Dict[str, Any]) -> Comment:
+    """Build Comment from a GraphQL IssueComment node."""
+    return _comment_from_api(
+        {
+            "id": node["databaseId"],
+            "body": node.get("body"),
+            "user": node.get("author") or {},
+            "created_at": node["createdAt"],
+            "updated_at": node.get("updatedAt"),
+        }
+    )
+
+
+def _graphql_url(api_url: str) -> str:
+    """GraphQL endpoint for a REST base URL (GHE: /api/v3 -> /api/graphql)."""
+    if api_url.endswith("/v3"):
+        return api_url[: -len("/v3")] + "/graphql"
+    return f"{api_url}/graphql"
+
+
+def _norm_path(path: str) -> str:
+    """API path with exactly one leading slash."""
+    return path if path[:1] == "/" else "/" + path
+
+
+def _issue_path(repo: str, issue_number: int) -> str:
+    return f"/repos/{repo}/issues/{issue_number}"
+
+
+def _issue_comments_path(repo: str, issue_number: int) -> str:
+    return f"/repos/{repo}/issues/{issue_number}/comments"
+
+
+def _build_session(token: str) -> requests.Session:
+    """Create a session with a pooled keep-alive transport.
+
+    Transient 5xx responses are retried with backoff for idempotent
+    methods only; POST/PATCH are never retried so comments and PRs are not
+    created twice. When retries run out, the last 5xx response is returned
+    (raise_on_status=False) so _request maps it to GitPlatformError.
+    """
+    session = requests.Session()
+    transport = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", transport)
+    session.mount("http://", transport)
+    session.headers["Authorization"] = f"token {token}"
+    session.headers["Accept"] = "application/vnd.github.v3+json"
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def _page_urls(last_url: str) -> List[str]:
+    """Build URLs for pages 2..N from the Link rel=last URL (same query, page=k)."""
+    parts = urlsplit(last_url)
+    query = parse_qs(parts.query)
+    last_page = int((query.get("page") or ["1"])[0])
+    urls = []
+    for page in range(2, last_page + 1):
+        query["page"] = [str(page)]
+        urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+
 def _pr_from_api(data: Dict[str, Any]) -> PR:
     head = data.get("head") or {}
     base = data.get("base") or {}
-    return PR(
+    return PR.model_construct(
         number=data["number"],
         title=data.get("title") or "",
         body=data.get("body") or "",
@@ -59,7 +203,7 @@ def _review_comment_from_api(data: Dict[str, Any]) -> ReviewComment:
     user = data.get("user") or {}
     created = _parse_iso(data["created_at"])
     updated = _parse_iso(data.get("updated_at") or data["created_at"])
-    return ReviewComment(
+    return ReviewComment.model_construct(
         id=data["id"],
         body=data.get("body") or "",
         author=user.get("login", ""),
@@ -77,9 +221,10 @@ class GitHubAdapter(GitPlatformAdapter):
 
     def __init__(self, token: str, api_url: str = "https://api.github.com") -> None:
         self._api_url = api_url.rstrip("/")
-        self._session = requests.Session()
-        self._session.headers["Authorization"] = f"token {token}"
-        self._session.headers["Accept"] = "application/vnd.github.v3+json"
+        self._session = _build_session(token)
+        # Conditional GET cache: URL (+ sorted params) -> (ETag, last 200 response)
+        self._etag_cache: Dict[str, Tuple[str, requests.Response]] = {}
+        self._etag_lock = threading.Lock()
 
     def _request(
         self,
@@ -87,28 +232,117 @@ class GitHubAdapter(GitPlatformAdapter):
         path: str,
         params: Dict[str, Any] | None = None,
         json: Dict[str, Any] | None = None,
+        not_found: str | None = None,
     ) -> requests.Response:
-        url = f"{self._api_url}{path}" if path.startswith("/") else f"{self._api_url}/{path}"
-        resp = self._session.request(method, url, params=params, json=json, timeout=30)
+        """Send a request and raise GitPlatformError on 4xx/5xx and on
+        transport failures (connection errors, exhausted retries).
+
+        GETs are conditional: the ETag of the last 200 for the same URL and
+        params is sent as If-None-Match, and a 304 returns that cached
+        response (no body transfer, no rate-limit cost). not_found replaces
+        the error message on 404.
+        """
+        url = path if path.startswith(("http://", "https://")) else self._api_url + _norm_path(path)
+        cache_key = None
+        cached = None
+        headers = None
+        if method == "GET":
+            cache_key = url if not params else f"{url}?{urlencode(sorted(params.items()))}"
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
+        try:
+            resp = self._session.request(method, url, params=params, json=json, headers=headers, timeout=30)
+        except requests.RequestException as e:
+            raise GitPlatformError(f"{method} {url} failed: {e}") from e
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]
         if resp.status_code >= 400:
+            if resp.status_code == 404 and not_found:
+                raise GitPlatformError(not_found)
             msg = resp.text or resp.reason or str(resp.status_code)
             try:
                 msg = resp.json().get("message", msg)
             except Exception:
                 pass
             raise GitPlatformError(f"{resp.status_code}: {msg}")
+        if cache_key is not None:
+            etag = resp.headers.get("ETag")
+            if isinstance(etag, str) and etag:
+                with self._etag_lock:
+                    if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+                        self._etag_cache.pop(next(iter(self._etag_cache)))
+                    self._etag_cache[cache_key] = (etag, resp)
         return resp
 
+    def _get_paginated(self, path: str, params: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+        """GET a list endpoint with per_page=100 and return items from all
+        pages.
+
+        When the first response has Link rel=last, the remaining pages are
+        fetched concurrently on the shared session; otherwise rel=next is
+        followed page by page.
+        """
+        items: List[Dict[str, Any]] = []
+        resp = self._request("GET", path, params={**(params or {}), "per_page": PER_PAGE})
+        items.extend(resp.json() or [])
+        last_link = resp.links.get("last")
+        if last_link:
+            urls = _page_urls(last_link["url"])
+            if urls:
+                with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(urls))) as pool:
+                    for page_resp in pool.map(lambda u: self._request("GET", u), urls):
+                        items.extend(page_resp.json() or [])
+            return items
+        next_link = resp.links.get("next")
+        while next_link:
+            # The next URL already carries all query params
+            resp = self._request("GET", next_link["url"])
+            items.extend(resp.json() or [])
+            next_link = resp.links.get("next")
+        return items
+
     def get_issue(self, repo: str, issue_number: int) -> Issue:
-        path = f"/repos/{repo}/issues/{issue_number}"
-        url = f"{self._api_url}{path}"
-        resp = self._session.request("GET", url, timeout=30)
-        if resp.status_code == 404:
+        resp = self._request(
+            "GET",
+            _issue_path(repo, issue_number),
+            not_found=f"Not found: issue #{issue_number}",
+        )
+        return _issue_from_api(resp.json())
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a GraphQL query; return the data object or raise
+        GitPlatformError."""
+        resp = self._request("POST", _graphql_url(self._api_url), json={"query": query, "variables": variables})
+        body = resp.json() or {}
+        if body.get("errors"):
+            raise GitPlatformError(f"GraphQL: {body['errors'][0].get('message', body['errors'])}")
+        return body.get("data") or {}
+
+    def fetch_issue_bundle(self, repo: str, issue_number: int) -> Tuple[Issue, List[Comment]]:
+        """Fetch issue, labels and comments via GraphQL.
+
+        One request covers the issue and its first 100 comments; longer
+        threads are paged with comments(after:) while pageInfo.hasNextPage.
+        Review comments of linked PRs are not included (use
+        list_pr_review_comments).
+        """
+        owner, _, name = repo.partition("/")
+        variables: Dict[str, Any] = {"owner": owner, "name": name, "number": issue_number}
+        data = self._graphql(_ISSUE_BUNDLE_QUERY, variables)
+        node = (data.get("repository") or {}).get("issue")
+        if not node:
             raise GitPlatformError(f"Not found: issue #{issue_number}")
-        if resp.status_code >= 400:
-            raise GitPlatformError(f"{resp.status_code}: {resp.text or resp.reason}")
-        data = resp.json()
-        return _issue_from_api(data)
+        issue = _issue_from_graphql(node)
+        comments_conn = node.get("comments") or {}
+        comments = [_comment_from_graphql(c) for c in comments_conn.get("nodes") or []]
+        page_info = comments_conn.get("pageInfo") or {}
+        while page_info.get("hasNextPage") and page_info.get("endCursor"):
+            data = self._graphql(_ISSUE_COMMENTS_QUERY, {**variables, "after": page_info["endCursor"]})
+            comments_conn = ((data.get("repository") or {}).get("issue") or {}).get("comments") or {}
+            comments.extend(_comment_from_graphql(c) for c in comments_conn.get("nodes") or [])
+            page_info = comments_conn.get("pageInfo") or {}
+        return issue, comments
 
     def get_issue_comments(
         self,
@@ -116,27 +350,19 @@ class GitHubAdapter(GitPlatformAdapter):
         issue_number: int,
         since: datetime | None = None,
     ) -> List[Comment]:
-        path = f"/repos/{repo}/issues/{issue_number}/comments"
+        path = _issue_comments_path(repo, issue_number)
         params: Dict[str, Any] = {}
         if since is not None:
             params["since"] = since.isoformat()
-        url = f"{self._api_url}{path}"
-        resp = self._session.request("GET", url, params=params or None, timeout=30)
-        if resp.status_code >= 400:
-            raise GitPlatformError(f"{resp.status_code}: {resp.text or resp.reason}")
-        data = resp.json() or []
+        data = self._get_paginated(path, params=params)
         return [_comment_from_api(d) for d in data]
 
     def create_comment(self, repo: str, issue_number: int, body: str) -> Comment:
-        path = f"/repos/{repo}/issues/{issue_number}/comments"
-        url = f"{self._api_url}{path}"
-        resp = self._session.request("POST", url, json={"body": body}, timeout=30)
-        if resp.status_code >= 400:
-            raise GitPlatformError(f"{resp.status_code}: {resp.text or resp.reason}")
+        resp = self._request("POST", _issue_comments_path(repo, issue_number), json={"body": body})
         return _comment_from_api(resp.json())
 
     def set_issue_labels(self, repo: str, issue_number: int, labels: List[str]) -> None:
-        path = f"/repos/{repo}/issues/{issue_number}/labels"
+        path = f"{_issue_path(repo, issue_number)}/labels"
         self._request("PUT", path, json={"labels": labels})
 
     def get_default_branch(self, repo: str) -> str:
@@ -180,13 +406,11 @@ class GitHubAdapter(GitPlatformAdapter):
         return _pr_from_api(resp.json())
 
     def list_open_issues(self, repo: str) -> List[Issue]:
-        resp = self._request("GET", f"/repos/{repo}/issues", params={"state": "open"})
-        data = resp.json() or []
+        data = self._get_paginated(f"/repos/{repo}/issues", params={"state": "open"})
         return [_issue_from_api(d) for d in data if "pull_request" not in d]
 
     def list_pr_review_comments(self, repo: str, pr_number: int) -> List[ReviewComment]:
-        resp = self._request("GET", f"/repos/{repo}/pulls/{pr_number}/comments")
-        data = resp.json() or []
+        data = self._get_paginated(f"/repos/{repo}/pulls/{pr_number}/comments")
         return [_review_comment_from_api(d) for d in data]
 
     def reply_to_review_comment(
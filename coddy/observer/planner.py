@@ -40,9 +40,10 @@ def format_plan_request(plan: str) -> str:
 
 def is_affirmative_comment(body: str) -> bool:
     """True if comment body indicates user confirmation (yes / да / etc.)."""
-    if not body or not body.strip():
+    if not body:
         return False
-    return bool(AFFIRMATIVE_RE.search(body.strip()))
+    text = body.strip()
+    return bool(text) and AFFIRMATIVE_RE.search(text) is not None
 
 
 def run_planner(
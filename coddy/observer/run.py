@@ -10,9 +10,12 @@ or development loop - that is done by the worker.
 
 import argparse
 import logging
+import ssl
 import sys
 from pathlib import Path
 
+from requests.certs import where as ca_bundle_path
+
 from coddy.config import AppConfig, LoggingConfig, load_config
 from coddy.logging import CoddyLogging
 from coddy.observer.webhook.handlers import _working_dir_from_config
@@ -40,10 +43,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _warm_up() -> None:
+    """Pay one-off startup costs before the first webhook arrives.
+
+    Loads the CA bundle used by requests into an SSL context so the first
+    HTTPS call to the platform API does not parse it on the request path.
+    """
+    try:
+        ssl.create_default_context(cafile=ca_bundle_path())
+    except (OSError, ssl.SSLError):
+        pass
+
+
 def run_observer(config: AppConfig) -> None:
     """Run the webhook server (plan on assignment, no polling)."""
     CoddyLogging(config.logging).setup()
     log = logging.getLogger("coddy.observer.run")
+    _warm_up()
 
     if not config.webhook.enabled:
         log.warning("Webhook disabled in config; observer will do nothing useful.")
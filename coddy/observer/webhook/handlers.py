@@ -6,15 +6,24 @@ queued.
 """
 
 import logging
-import sys
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from coddy.observer.adapters.github import GitHubAdapter
+from coddy.observer.models import Issue
 from coddy.observer.planner import is_affirmative_comment, on_user_confirmed, run_planner
 from coddy.services.git import GitRunnerError, run_git_pull
 from coddy.services.store import (
+    IssueFile,
     add_comment,
     create_issue,
     delete_comment,
@@ -26,6 +35,136 @@ from coddy.services.store import (
 )
 from coddy.worker.agents.cursor_cli_agent import make_cursor_cli_agent
 
+# Recently handled X-GitHub-Delivery ids (GitHub redelivers on timeouts and retries).
+# Kept in memory and, per workspace, in DELIVERIES_DB so a restart does not replay them.
+DELIVERY_CACHE_SIZE = 4096
+DELIVERY_TTL = 7200.0
+DELIVERIES_DB = ".coddy/webhook_deliveries.sqlite"
+
+_seen_deliveries: OrderedDict[str, float] = OrderedDict()
+_seen_deliveries_lock = threading.Lock()
+_delivery_dbs: Dict[str, sqlite3.Connection] = {}
+
+
+def _delivery_db(work_dir: Path) -> sqlite3.Connection:
+    """Connection to the workspace's delivery table, opened once (caller holds
+    _seen_deliveries_lock)."""
+    key = os.fspath(work_dir)
+    conn = _delivery_dbs.get(key)
+    if conn is None:
+        path = Path(work_dir) / DELIVERIES_DB
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY, ts REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS seen_ts ON seen (ts)")
+        _delivery_dbs[key] = conn
+    return conn
+
+
+def _is_duplicate_delivery(
+    delivery_id: str,
+    work_dir: Path | None = None,
+    log: logging.Logger | None = None,
+) -> bool:
+    """True if delivery_id was already handled within DELIVERY_TTL.
+
+    Nothing is recorded here; ids are added by _mark_delivery_handled once
+    their handler has returned. With work_dir, ids not in memory are also
+    checked against the workspace's SQLite table. If the table cannot be
+    used, dedup falls back to memory only.
+    """
+    now = time.time()
+    with _seen_deliveries_lock:
+        _expire_seen_deliveries(now)
+        if delivery_id in _seen_deliveries:
+            return True
+        if work_dir is None:
+            return False
+        try:
+            conn = _delivery_db(work_dir)
+            row = conn.execute(
+                "SELECT 1 FROM seen WHERE id = ? AND ts >= ?",
+                (delivery_id, now - DELIVERY_TTL),
+            ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            if log:
+                log.warning("Webhook delivery store unavailable, dedup is in-memory only: %s", e)
+            return False
+        return row is not None
+
+
+def _mark_delivery_handled(
+    delivery_id: str,
+    work_dir: Path | None = None,
+    log: logging.Logger | None = None,
+) -> None:
+    """Remember delivery_id as handled, in memory and (with work_dir) in the
+    workspace's SQLite table. Called only after its handler returned, so a
+    redelivery of an event whose handler raised is processed again, also
+    after a restart."""
+    now = time.time()
+    with _seen_deliveries_lock:
+        _seen_deliveries[delivery_id] = now
+        _seen_deliveries.move_to_end(delivery_id)
+        if len(_seen_deliveries) > DELIVERY_CACHE_SIZE:
+            _seen_deliveries.popitem(last=False)
+        if work_dir is None:
+            return
+        try:
+            conn = _delivery_db(work_dir)
+            conn.execute("DELETE FROM seen WHERE ts < ?", (now - DELIVERY_TTL,))
+            conn.execute("INSERT OR REPLACE INTO seen (id, ts) VALUES (?, ?)", (delivery_id, now))
+        except (OSError, sqlite3.Error) as e:
+            if log:
+                log.warning("Webhook delivery store unavailable, dedup is in-memory only: %s", e)
+
+
+def _expire_seen_deliveries(now: float) -> None:
+    """Drop in-memory ids older than DELIVERY_TTL (caller holds _seen_deliveries_lock)."""
+    while _seen_deliveries:
+        oldest_id, seen_at = next(iter(_seen_deliveries.items()))
+        if now - seen_at <= DELIVERY_TTL:
+            break
+        del _seen_deliveries[oldest_id]
+
+
+# Issues fetched for the planner: (repo, number) -> (fetched_at, Issue); absorbs assignment bursts
+ISSUE_CACHE_TTL = 60.0
+
+_issue_cache: Dict[Tuple[str, int], Tuple[float, Issue]] = {}
+_issue_cache_lock = threading.Lock()
+
+
+def _cached_get_issue(adapter: GitHubAdapter, repo: str, issue_number: int) -> Issue:
+    """adapter.get_issue with a short TTL cache."""
+    key = (repo, issue_number)
+    with _issue_cache_lock:
+        cached = _issue_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= ISSUE_CACHE_TTL:
+            return cached[1]
+    issue = adapter.get_issue(repo, issue_number)
+    now = time.monotonic()
+    with _issue_cache_lock:
+        for stale in [k for k, (fetched_at, _) in _issue_cache.items() if now - fetched_at > ISSUE_CACHE_TTL]:
+            del _issue_cache[stale]
+        _issue_cache[key] = (now, issue)
+    return issue
+
+
+def _forget_issue(repo: str, issue_number: int) -> None:
+    """Drop a cached issue (e.g. after it was edited)."""
+    with _issue_cache_lock:
+        _issue_cache.pop((repo, issue_number), None)
+
+
+@lru_cache(maxsize=8)
+def _get_adapter(token: str, api_url: str) -> GitHubAdapter:
+    """Shared adapter per (token, api_url), so its HTTP session (keep-alive
+    connections) and ETag cache persist across webhook deliveries."""
+    return GitHubAdapter(token=token, api_url=api_url)
+
 
 def _working_dir_from_config(config: Any) -> Path:
     """Resolve workspace path (sources and .coddy/) from config."""
@@ -39,53 +178,116 @@ def _working_dir_from_config(config: Any) -> Path:
     return Path.cwd()
 
 
+@dataclass(frozen=True, slots=True)
+class _BotCtx:
+    """Config values the handlers read on every event, resolved once per config.
+
+    The GitHub token is deliberately not captured: config.github_token_resolved
+    re-reads the env / secret file on each access, so a rotated token is used
+    by the next event.
+    """
+
+    repository: str
+    username: str | None
+    git_platform: str
+    default_branch: str
+    api_url: str
+    workspace_dir: Path
+
+
+# id(config) -> _BotCtx; entries are dropped when the config is garbage-collected
+_bot_ctx_cache: Dict[int, _BotCtx] = {}
+
+
+def _bot_ctx(config: Any) -> _BotCtx:
+    """Return the cached _BotCtx for config, building it on first use."""
+    ctx = _bot_ctx_cache.get(id(config))
+    if ctx is not None:
+        return ctx
+    bot = config.bot
+    ctx = _BotCtx(
+        repository=getattr(bot, "repository", ""),
+        username=getattr(bot, "username", None),
+        git_platform=getattr(bot, "git_platform", ""),
+        default_branch=getattr(bot, "default_branch", "main"),
+        api_url=getattr(getattr(config, "github", None), "api_url", "https://api.github.com"),
+        workspace_dir=_working_dir_from_config(config),
+    )
+    _bot_ctx_cache[id(config)] = ctx
+    weakref.finalize(config, _bot_ctx_cache.pop, id(config), None)
+    return ctx
+
+
+# Set once a merged PR was pulled; run_webhook_server stops serving, handles the
+# events still queued and returns, so the supervisor restarts on the pulled code
+restart_requested = threading.Event()
+
+
+def _request_restart() -> None:
+    """Ask run_webhook_server to stop and return once the event queue is drained."""
+    restart_requested.set()
+
+
+def _pull_and_restart(default_branch: str, working_dir: Path, logger: logging.Logger) -> None:
+    """git pull the default branch, then request a restart (not on pull failure)."""
+    try:
+        run_git_pull(default_branch, repo_dir=working_dir, log=logger)
+    except GitRunnerError as e:
+        logger.warning("PR merged: git pull failed - %s", e)
+        return
+    logger.info("PR merged: pulled origin/%s, restarting once queued events are handled", default_branch)
+    _request_restart()
+
+
 def _handle_pull_request_closed(
     config: Any,
     payload: Dict[str, Any],
     repo_dir: Path | None = None,
     log: logging.Logger | None = None,
 ) -> None:
-    """On PR closed: set PR status (merged/closed) in .coddy/prs/, then if merged pull and exit."""
+    """On PR closed: set PR status (merged/closed) in .coddy/prs/, then if merged pull and exit.
+
+    Runs on the webhook event worker, so the pull happens in delivery order
+    with the other events and never overlaps a planner run on the clone.
+    """
     logger = log or logging.getLogger("coddy.observer.webhook.handlers")
     if payload.get("action") != "closed":
         return
+    ctx = _bot_ctx(config)
     pull = payload.get("pull_request") or {}
     pr_number = pull.get("number")
     repo_payload = payload.get("repository") or {}
     repo_full_name = repo_payload.get("full_name") or ""
-    if repo_full_name and repo_full_name != getattr(config.bot, "repository", ""):
-        logger.debug("Skipping PR closed: repository %s is not configured repo", repo_full_name)
-        return
-    working_dir = Path(repo_dir) if repo_dir is not None else _working_dir_from_config(config)
+    working_dir = Path(repo_dir) if repo_dir is not None else ctx.workspace_dir
     if pr_number is not None and repo_full_name:
         status = "merged" if pull.get("merged") else "closed"
         set_pr_status(working_dir, int(pr_number), status, repo=repo_full_name)
 
     if not pull.get("merged"):
         return
-    if getattr(config.bot, "git_platform", "") != "github":
+    if ctx.git_platform != "github":
         logger.debug("Skipping PR merged: platform is not github")
         return
-    default_branch = getattr(config.bot, "default_branch", "main")
-    try:
-        run_git_pull(default_branch, repo_dir=working_dir, log=logger)
-    except GitRunnerError as e:
-        logger.warning("PR merged: git pull failed - %s", e)
-        return
-    logger.info("PR merged: pulled origin/%s, exiting for restart", default_branch)
-    sys.exit(0)
+    _pull_and_restart(ctx.default_branch, working_dir, logger)
 
 
 def _parse_comment_timestamp(iso_str: str | None) -> int | None:
     """Parse GitHub ISO date to Unix timestamp, or None if missing/invalid."""
     if not iso_str:
         return None
+    return _iso_to_timestamp(str(iso_str))
+
+
+@lru_cache(maxsize=1024)
+def _iso_to_timestamp(iso_str: str) -> int | None:
+    """Memoized ISO -> Unix conversion; the same created_at/updated_at values
+    repeat across edit bursts on a comment."""
     try:
-        dt = datetime.fromisoformat(str(iso_str).replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=UTC)
         return int(dt.timestamp())
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
@@ -99,25 +301,26 @@ def _handle_issue_comment(
     action = payload.get("action")
     if action not in ("created", "edited", "deleted"):
         return
+    ctx = _bot_ctx(config)
     comment_payload = payload.get("comment") or {}
     body = comment_payload.get("body") or ""
     user = comment_payload.get("user") or {}
     author = user.get("login", "")
     comment_id = comment_payload.get("comment_id") or comment_payload.get("id")
-    bot_username = getattr(config.bot, "username", None)
+    bot_username = ctx.username
     issue_payload = payload.get("issue") or {}
     issue_number = issue_payload.get("number")
     if issue_number is None:
         return
-    repo_payload = payload.get("repository") or {}
-    repo = repo_payload.get("full_name") or getattr(config.bot, "repository", "")
-    if not repo or repo != getattr(config.bot, "repository", ""):
+    repo = ctx.repository
+    if not repo:
         return
-    issue_file = load_issue(repo_dir, int(issue_number))
 
     if action == "created":
+        # Bot's own comments (plans, replies) are frequent; drop them before touching the store
         if bot_username and author == bot_username:
             return
+        issue_file = load_issue(repo_dir, int(issue_number))
         if issue_file:
             ts_created = _parse_comment_timestamp(comment_payload.get("created_at"))
             ts_updated = _parse_comment_timestamp(comment_payload.get("updated_at"))
@@ -134,10 +337,7 @@ def _handle_issue_comment(
         if issue_file and issue_file.status == "waiting_confirmation" and is_affirmative_comment(body):
             token = getattr(config, "github_token_resolved", None)
             if token:
-                adapter = GitHubAdapter(
-                    token=token,
-                    api_url=getattr(config.github, "api_url", "https://api.github.com"),
-                )
+                adapter = _get_adapter(token, ctx.api_url)
                 on_user_confirmed(
                     adapter,
                     int(issue_number),
@@ -153,46 +353,56 @@ def _handle_issue_comment(
                 log.warning("No GitHub token; cannot post reply")
         return
 
+    # update_comment/delete_comment load the issue themselves and no-op when it is missing
     if action == "edited":
-        if issue_file and comment_id is not None:
+        if comment_id is not None:
             ts_updated = _parse_comment_timestamp(comment_payload.get("updated_at"))
             if update_comment(repo_dir, int(issue_number), int(comment_id), body, updated_at=ts_updated):
                 log.debug("Updated comment %s on issue #%s", comment_id, issue_number)
         return
 
     if action == "deleted":
-        if issue_file and comment_id is not None:
+        if comment_id is not None:
             if delete_comment(repo_dir, int(issue_number), int(comment_id)):
                 log.debug("Deleted comment %s on issue #%s", comment_id, issue_number)
         return
 
 
-def _ensure_issue_in_store(config: Any, payload: Dict[str, Any], repo_dir: Path, log: logging.Logger) -> bool:
+def _ensure_issue_in_store(
+    config: Any,
+    payload: Dict[str, Any],
+    repo_dir: Path,
+    log: logging.Logger,
+    now_ts: int | None = None,
+) -> IssueFile | None:
     """Create issue in store from payload if not present.
 
-    Returns True if repo matches and issue stored.
+    now_ts is the event time (Unix seconds) used for assigned_at; defaults
+    to the current time. Returns the stored issue (existing or just created),
+    or None if the repo does not match or the payload has no issue number.
     """
-    repo_payload = payload.get("repository") or {}
-    repo = repo_payload.get("full_name") or getattr(config.bot, "repository", "")
-    if not repo or repo != getattr(config.bot, "repository", ""):
-        return False
+    ctx = _bot_ctx(config)
+    repo = ctx.repository
+    if not repo:
+        return None
     issue_payload = payload.get("issue") or {}
     issue_number = issue_payload.get("number")
     if issue_number is None:
-        return False
+        return None
     existing = load_issue(repo_dir, int(issue_number))
     if existing:
-        return True
+        return existing
     title = issue_payload.get("title") or ""
     body = issue_payload.get("body") or ""
     user_payload = issue_payload.get("user") or {}
     author = user_payload.get("login") or "unknown"
     assignees = issue_payload.get("assignees") or []
     first_assignee = assignees[0].get("login") if assignees and isinstance(assignees[0], dict) else None
-    now_ts = int(datetime.now(UTC).timestamp())
+    if now_ts is None:
+        now_ts = int(time.time())
     assigned_at = now_ts if first_assignee else None
     assigned_to = first_assignee
-    create_issue(
+    return create_issue(
         repo_dir,
         int(issue_number),
         repo,
@@ -202,20 +412,20 @@ def _ensure_issue_in_store(config: Any, payload: Dict[str, Any], repo_dir: Path,
         assigned_at=assigned_at,
         assigned_to=assigned_to,
     )
-    return True
 
 
 def _handle_issues(config: Any, payload: Dict[str, Any], repo_dir: Path, log: logging.Logger) -> None:
     """Store all issue events; run planner only when action=assigned and
     assignee is bot."""
+    ctx = _bot_ctx(config)
+    now_ts = int(time.time())
     action = payload.get("action")
     issue_payload = payload.get("issue") or {}
     issue_number = issue_payload.get("number")
-    repo_payload = payload.get("repository") or {}
-    repo = repo_payload.get("full_name") or getattr(config.bot, "repository", "")
+    repo = ctx.repository
 
     if action == "closed":
-        if issue_number is not None and repo and repo == getattr(config.bot, "repository", ""):
+        if issue_number is not None and repo:
             if not load_issue(repo_dir, int(issue_number)):
                 title = issue_payload.get("title") or ""
                 body = issue_payload.get("body") or ""
@@ -226,36 +436,37 @@ def _handle_issues(config: Any, payload: Dict[str, Any], repo_dir: Path, log: lo
             log.info("Issue #%s closed, status -> closed", issue_number)
         return
     if action == "edited":
-        if issue_number is not None and repo and repo == getattr(config.bot, "repository", ""):
+        if issue_number is not None and repo:
+            _forget_issue(repo, int(issue_number))
             issue_file = load_issue(repo_dir, int(issue_number))
             if issue_file:
                 issue_file.title = issue_payload.get("title") or issue_file.title
                 issue_file.description = issue_payload.get("body") or issue_file.description
-                issue_file.updated_at = int(datetime.now(UTC).timestamp())
+                issue_file.updated_at = now_ts
                 save_issue(repo_dir, int(issue_number), issue_file)
                 log.debug("Issue #%s updated (title/description)", issue_number)
         return
     if action == "unassigned":
-        if issue_number is not None and repo and repo == getattr(config.bot, "repository", ""):
+        if issue_number is not None and repo:
             issue_file = load_issue(repo_dir, int(issue_number))
             if issue_file:
                 issue_file.assigned_at = None
                 issue_file.assigned_to = None
-                issue_file.updated_at = int(datetime.now(UTC).timestamp())
+                issue_file.updated_at = now_ts
                 save_issue(repo_dir, int(issue_number), issue_file)
                 log.debug("Issue #%s unassigned, cleared assigned_at/assigned_to", issue_number)
         return
     if action in ("opened", "assigned"):
-        _ensure_issue_in_store(config, payload, repo_dir, log)
+        issue_file = _ensure_issue_in_store(config, payload, repo_dir, log, now_ts=now_ts)
         if action == "assigned":
             assignees = issue_payload.get("assignees") or []
             first_assignee = assignees[0].get("login") if assignees and isinstance(assignees[0], dict) else None
-            if first_assignee and issue_number is not None and repo and repo == getattr(config.bot, "repository", ""):
-                issue_file = load_issue(repo_dir, int(issue_number))
-                if issue_file:
-                    issue_file.assigned_at = int(datetime.now(UTC).timestamp())
-                    issue_file.assigned_to = first_assignee
-                    save_issue(repo_dir, int(issue_number), issue_file)
+            # A just-created issue already carries this assignment; only an existing one needs a write
+            assignment = (first_assignee, now_ts)
+            if first_assignee and issue_file and (issue_file.assigned_to, issue_file.assigned_at) != assignment:
+                issue_file.assigned_at = now_ts
+                issue_file.assigned_to = first_assignee
+                save_issue(repo_dir, int(issue_number), issue_file)
             _handle_issues_assigned(config, payload, repo_dir, log)
 
 
@@ -269,9 +480,10 @@ def _handle_issues_assigned(
     _handle_issues)."""
     if payload.get("action") != "assigned":
         return
+    ctx = _bot_ctx(config)
     issue_payload = payload.get("issue") or {}
     assignees = issue_payload.get("assignees") or []
-    bot_username = getattr(config.bot, "username", None)
+    bot_username = ctx.username
     if not bot_username:
         log.debug("Skipping work on issues.assigned: no bot username configured")
         return
@@ -279,22 +491,18 @@ def _handle_issues_assigned(
     if bot_username not in logins:
         log.debug("Skipping work on issues.assigned: assignee is not bot (%s)", bot_username)
         return
-    repo_payload = payload.get("repository") or {}
-    repo = repo_payload.get("full_name") or getattr(config.bot, "repository", "")
-    if not repo or repo != getattr(config.bot, "repository", ""):
-        log.debug("Skipping issues.assigned: repository %s not configured", repo)
+    repo = ctx.repository
+    if not repo:
+        log.debug("Skipping issues.assigned: no repository configured")
         return
     issue_number = issue_payload.get("number")
     if issue_number is None:
         return
     token = getattr(config, "github_token_resolved", None)
-    if token and getattr(config.bot, "git_platform", "") == "github":
+    if token and ctx.git_platform == "github":
         try:
-            adapter = GitHubAdapter(
-                token=token,
-                api_url=getattr(config.github, "api_url", "https://api.github.com"),
-            )
-            issue = adapter.get_issue(repo, int(issue_number))
+            adapter = _get_adapter(token, ctx.api_url)
+            issue = _cached_get_issue(adapter, repo, int(issue_number))
             agent = make_cursor_cli_agent(config)
             run_planner(
                 adapter,
@@ -314,12 +522,21 @@ def _handle_issues_assigned(
         )
 
 
+# event name -> handler(config, payload, repo_dir, log)
+_DISPATCH: Dict[str, Callable[[Any, Dict[str, Any], Path, logging.Logger], None]] = {
+    "pull_request": _handle_pull_request_closed,
+    "issues": _handle_issues,
+    "issue_comment": _handle_issue_comment,
+}
+
+
 def handle_github_event(
     config: Any,
     event: str,
     payload: Dict[str, Any],
     repo_dir: Path | None = None,
     log: logging.Logger | None = None,
+    delivery_id: str | None = None,
 ) -> None:
     """Handle a GitHub webhook event.
 
@@ -327,18 +544,25 @@ def handle_github_event(
     - pull_request (action=closed, merged=true): git pull from default branch, then exit 0 to allow restart.
     - issues (action=assigned): if bot is in assignees, enqueue task for worker.
     - issue_comment: on user confirmation set issue status to queued.
+
+    Events for a repository other than bot.repository are dropped here, so
+    the per-event handlers only see the configured repo. A delivery_id
+    (X-GitHub-Delivery) already handled within DELIVERY_TTL is skipped, so
+    redelivered events are not processed twice. An id counts as handled only
+    once its handler returns; if the handler raises, a redelivery runs again.
     """
     logger = log or logging.getLogger("coddy.observer.webhook.handlers")
-    work_dir = Path(repo_dir) if repo_dir is not None else _working_dir_from_config(config)
-
-    if event == "pull_request":
-        _handle_pull_request_closed(config, payload, repo_dir=work_dir, log=logger)
-        return
-
-    if event == "issues":
-        _handle_issues(config, payload, work_dir, logger)
+    ctx = _bot_ctx(config)
+    repo_full_name = (payload.get("repository") or {}).get("full_name")
+    if repo_full_name and repo_full_name != ctx.repository:
+        logger.debug("Skipping %s event: repository %s is not configured repo", event, repo_full_name)
         return
-
-    if event == "issue_comment":
-        _handle_issue_comment(config, payload, work_dir, logger)
+    work_dir = Path(repo_dir) if repo_dir is not None else ctx.workspace_dir
+    if delivery_id and _is_duplicate_delivery(delivery_id, work_dir, logger):
+        logger.info("Skipping duplicate webhook delivery %s (%s)", delivery_id, event)
         return
+    handler = _DISPATCH.get(event)
+    if handler is not None:
+        handler(config, payload, work_dir, logger)
+    if delivery_id:
+        _mark_delivery_handled(delivery_id, work_dir, logger)
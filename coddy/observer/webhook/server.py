@@ -4,28 +4,68 @@ Serves health check and webhook path; verification and handlers to be
 added.
 """
 
+import hashlib
 import json
 import logging
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from urllib.parse import parse_qs
 
 from coddy.config import AppConfig
+from coddy.observer.webhook.handlers import handle_github_event, restart_requested
 
 LOG = logging.getLogger("coddy.observer.webhook")
 
+_HEALTH_BODY = json.dumps({"status": "ok", "service": "coddy"}).encode()
+_RECEIVED_BODY = json.dumps({"received": True}).encode()
+
+
+def _delivery_key(delivery_id: str | None, event: str, body: bytes) -> str:
+    """Dedup key for a delivery: the X-GitHub-Delivery id, or a content hash
+    of event + body when the header is missing (e.g. behind a proxy that
+    strips it), so bit-identical redeliveries are still recognized."""
+    if delivery_id:
+        return delivery_id
+    digest = hashlib.blake2b(event.encode(), digest_size=16)
+    digest.update(b"\0")
+    digest.update(body)
+    return "body:" + digest.hexdigest()
+
+
+def _handle_event(config: AppConfig, event: str, payload: dict, delivery_id: str | None) -> None:
+    """Run handle_github_event on the executor, logging failures (the
+    request that delivered the event has already been answered).
+
+    If the event requested a restart (PR merged and pulled), stop serving;
+    run_webhook_server then handles the events still queued and returns.
+    """
+    try:
+        handle_github_event(config, event, payload, delivery_id=delivery_id)
+    except Exception:
+        LOG.exception("Failed to handle webhook event %s (delivery %s)", event, delivery_id)
+    if restart_requested.is_set() and WebhookHandler.http_server is not None:
+        WebhookHandler.http_server.shutdown()
+
 
 class WebhookHandler(BaseHTTPRequestHandler):
     """Handle GET /health and POST /webhook/github (and others)."""
 
     config: AppConfig
+    # Events are handled off the request thread so GitHub gets its 200 right away.
+    # One worker: events are handled one at a time, in delivery order, so store
+    # updates for an issue (opened -> assigned -> comment) never interleave and
+    # planner runs (agent + git on the shared clone) never overlap.
+    executor: ThreadPoolExecutor
+    # The running server, stopped from the executor when a restart is requested.
+    http_server: ThreadingHTTPServer | None = None
 
     def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler API)
         if self.path == "/health" or self.path == "/":
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"status": "ok", "service": "coddy"}).encode())
+            self.wfile.write(_HEALTH_BODY)
             return
         self.send_response(404)
         self.end_headers()
@@ -51,7 +91,7 @@ class WebhookHandler(BaseHTTPRequestHandler):
             if raw is None:
                 return {}
             return json.loads(raw)
-        return json.loads(body.decode())
+        return json.loads(body)
 
     def _handle_github_webhook(self) -> None:
         length = int(self.headers.get("Content-Length", 0))
@@ -60,26 +100,50 @@ class WebhookHandler(BaseHTTPRequestHandler):
             payload = self._parse_webhook_body(body)
             event = self.headers.get("X-GitHub-Event", "")
             LOG.info("Webhook event: %s (payload keys: %s)", event, list(payload.keys()) if payload else [])
-            from coddy.observer.webhook.handlers import handle_github_event
-
-            handle_github_event(self.config, event, payload)
-        except json.JSONDecodeError:
+            self.executor.submit(
+                _handle_event,
+                self.config,
+                event,
+                payload,
+                _delivery_key(self.headers.get("X-GitHub-Delivery"), event, body),
+            )
+        except (json.JSONDecodeError, UnicodeDecodeError):
             payload_raw = body.decode("utf-8", errors="replace") if body else ""
             LOG.warning("Invalid webhook JSON. Full payload: %s", payload_raw)
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps({"received": True}).encode())
+        self.wfile.write(_RECEIVED_BODY)
 
     def log_message(self, format: str, *args: Any) -> None:
         LOG.debug(format, *args)
 
 
 def run_webhook_server(config: AppConfig) -> None:
-    """Run HTTP server for webhooks and health check."""
+    """Run HTTP server for webhooks and health check.
+
+    Each connection gets its own thread and events are queued to a single
+    handler thread, so health checks and new deliveries are answered while a
+    long-running event (git pull, planner) is still being handled.
+
+    When serving stops (restart after a merge, Ctrl-C), events still queued
+    are handled before this returns: they were already answered with 200, so
+    GitHub will not redeliver them. After a merge this returns normally once
+    the queue is empty, and the observer exits for the supervisor to restart.
+    """
     host = config.webhook.host
     port = config.webhook.port
     WebhookHandler.config = config
-    server = HTTPServer((host, port), WebhookHandler)
+    WebhookHandler.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coddy-webhook")
+    restart_requested.clear()
+    server = ThreadingHTTPServer((host, port), WebhookHandler)
+    WebhookHandler.http_server = server
     LOG.info("Webhook server listening on %s:%s", host, port)
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        WebhookHandler.executor.shutdown(wait=True)
+        WebhookHandler.http_server = None
+    if restart_requested.is_set():
+        LOG.info("Queued webhook events handled, exiting for restart")
@@ -8,8 +8,9 @@ from pathlib import Path
 from coddy.services.git._run import GitRunnerError, _run_git
 
 # Git ref name rules: no "..", no space, no ~ ^ : ? * [ \ ; output uses only a-z, 0-9, dash
-_INVALID_BRANCH_CHARS_RE = re.compile(r"[^a-z0-9\-]")
-_DOUBLE_DASH_RE = re.compile(r"-+")
+_SEPARATORS_TO_DASH = str.maketrans(" ._", "---")
+_INVALID_BRANCH_CHARS_RE = re.compile(r"[^a-z0-9\-]+")
+_VALID_BRANCH_NAME_RE = re.compile(r"[a-z0-9\-]+")
 
 
 def sanitize_branch_name(text: str, max_length: int = 100) -> str:
@@ -29,11 +30,9 @@ def sanitize_branch_name(text: str, max_length: int = 100) -> str:
     """
     if not text or not text.strip():
         return ""
-    s = text.lower().strip()
-    for char in " ._":
-        s = s.replace(char, "-")
-    s = _INVALID_BRANCH_CHARS_RE.sub("", s)
-    s = _DOUBLE_DASH_RE.sub("-", s).strip("-")
+    s = _INVALID_BRANCH_CHARS_RE.sub("", text.lower().translate(_SEPARATORS_TO_DASH))
+    # Collapse dash runs and strip edge dashes in one pass
+    s = "-".join(part for part in s.split("-") if part)
     if len(s) > max_length:
         s = s[:max_length].rstrip("-")
     return s
@@ -58,7 +57,7 @@ def is_valid_branch_name(name: str) -> bool:
         return False
     if name.startswith("-") or name.endswith("-"):
         return False
-    return bool(re.match(r"^[a-z0-9\-]+$", name))
+    return _VALID_BRANCH_NAME_RE.fullmatch(name) is not None
 
 
 def branch_name_from_issue(issue_id: int, title: str) -> str:
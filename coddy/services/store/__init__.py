@@ -4,6 +4,7 @@ from coddy.services.store.issue_store import (
     add_comment,
     create_issue,
     delete_comment,
+    iter_issues_by_status,
     list_issues_by_status,
     list_pending_plan,
     list_queued,
@@ -22,6 +23,7 @@ __all__ = [
     "add_comment",
     "create_issue",
     "delete_comment",
+    "iter_issues_by_status",
     "list_issues_by_status",
     "list_pending_plan",
     "list_queued",
@@ -0,0 +1,77 @@
+"""Internal helpers: YAML load/dump and atomic writes for store files."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file by its str path (no pathlib wrappers on the load path)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _file_sig(st: os.stat_result) -> tuple[int, int, int]:
+    """Cache validator for a store file: (mtime_ns, size, inode).
+
+    The inode catches a same-size rewrite within one mtime tick by another
+    process: _atomic_write always replaces the file with a new inode.
+    """
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _yaml_load(data: bytes) -> Any:
+    """Parse YAML from raw file bytes (libyaml detects the encoding)."""
+    return yaml.load(data, Loader=_Loader)
+
+
+def _yaml_dump(payload: Any) -> bytes:
+    """Serialize payload to UTF-8 YAML bytes in the store file format."""
+    return yaml.dump(
+        payload,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=1000,
+        encoding="utf-8",
+    )
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path atomically (temp file in the same dir, fsync,
+    os.replace).
+
+    Readers see either the old or the new file, never a partial one. The
+    temp name is unique per process and thread; mode follows the umask. The
+    parent dir is created only when the first open finds it missing.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(tmp, flags, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, flags, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
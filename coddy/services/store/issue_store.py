@@ -5,53 +5,156 @@ Status is updated in place (no moving files). Worker picks issues with status=qu
 """
 
 import logging
-from datetime import UTC, datetime
+import os
+import re
+import stat
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
+from pydantic import ValidationError
 
+from coddy.services.store._io import _atomic_write, _file_sig, _read_bytes, _yaml_dump, _yaml_load
 from coddy.services.store.schemas import IssueComment, IssueFile
 
 ISSUES_DIR = ".coddy/issues"
 
 LOG = logging.getLogger("coddy.services.store.issue_store")
 
+# How much of an issue file _peek_status scans for the status line
+_PEEK_BYTES = 4096
 
+# Status values _peek_status trusts; anything else (quotes, comments, flow
+# syntax) is left to the YAML parser
+_BARE_STATUS = re.compile(rb"[a-z_]+")
+
+# Shared pool for loading issue files in list_issues_by_status; bounds open files
+# on slow filesystems. Threads are started on first use.
+_IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="coddy-issue-io")
+
+# Parsed issue files: path -> (_file_sig, IssueFile)
+_issue_cache: dict[str, tuple[tuple[int, int, int], IssueFile]] = {}
+
+# Issue ids found in an issues dir: dir path -> (st_mtime_ns, ids)
+_dir_cache: dict[str, tuple[int, list[int]]] = {}
+
+# A dir listing is only reused when the dir changed longer ago than this, so
+# an entry added within the same mtime tick as the scan is not missed
+_RACY_NS = 2_000_000_000
+
+
+def _now_ts() -> int:
+    """Current Unix timestamp (seconds), read once per store operation."""
+    return int(time.time())
+
+
+@lru_cache(maxsize=32)
 def _issues_dir(repo_dir: Path) -> Path:
     return Path(repo_dir) / ISSUES_DIR
 
 
+@lru_cache(maxsize=1024)
 def _issue_path(repo_dir: Path, issue_id: int) -> Path:
     return _issues_dir(repo_dir) / f"{issue_id}.yaml"
 
 
+def _peek_status(path: Path | str) -> str | None:
+    """Read the top-level status line without parsing the whole YAML file.
+
+    Only the head of the file is scanned (status is written before title and
+    description). Returns None when the line is not found or its value is not
+    a bare [a-z_]+ token, so callers fall back to a full load.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_PEEK_BYTES)
+    except OSError:
+        return None
+    if head.startswith(b"status:"):
+        start = 0
+    else:
+        start = head.find(b"\nstatus:")
+        if start < 0:
+            return None
+        start += 1
+    end = head.find(b"\n", start)
+    if end < 0:
+        return None
+    value = head[start + len(b"status:") : end].strip()
+    if not _BARE_STATUS.fullmatch(value):
+        return None
+    return value.decode("ascii")
+
+
+def _cached_status(key: str, st: os.stat_result) -> str | None:
+    """Status of a cached issue when its file is unchanged, else None."""
+    cached = _issue_cache.get(key)
+    if cached is not None and cached[0] == _file_sig(st):
+        return cached[1].status
+    return None
+
+
+def _construct_trusted(payload: dict) -> IssueFile:
+    """Build IssueFile from a payload dumped from a validated IssueFile,
+    skipping validation (mirrors what load_issue would parse back)."""
+    comments = [IssueComment.model_construct(**c) for c in payload.get("comments") or []]
+    return IssueFile.model_construct(**{**payload, "comments": comments})
+
+
 def load_issue(repo_dir: Path, issue_id: int) -> IssueFile | None:
     """Load issue from .coddy/issues/{issue_id}.yaml.
 
+    Parsed issues are cached by file (mtime_ns, size, inode); an unchanged file is
+    returned from the cache without reading it. Callers get their own copy.
     Returns None if missing or invalid.
     """
     path = _issue_path(repo_dir, issue_id)
-    if not path.is_file():
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _issue_cache.pop(key, None)
+        return None
+    except OSError as e:
+        LOG.warning("Failed to load issue %s: %s", path, e)
         return None
+    cached = _issue_cache.get(key)
+    if cached is not None and cached[0] == _file_sig(st):
+        return cached[1].model_copy(deep=True)
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        if not data:
-            return None
-        data.setdefault("issue_id", issue_id)
-        return IssueFile.model_validate(data)
-    except (OSError, yaml.YAMLError, Exception) as e:
+        raw = _read_bytes(key)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
         LOG.warning("Failed to load issue %s: %s", path, e)
         return None
+    try:
+        data = _yaml_load(raw)
+    except yaml.YAMLError as e:
+        LOG.warning("Failed to load issue %s: %s", path, e)
+        return None
+    if not data:
+        return None
+    if not isinstance(data, dict):
+        LOG.warning("Failed to load issue %s: expected a mapping, got %s", path, type(data).__name__)
+        return None
+    data.setdefault("issue_id", issue_id)
+    try:
+        issue = IssueFile.model_validate(data)
+    except ValidationError as e:
+        LOG.warning("Failed to load issue %s: %s", path, e)
+        return None
+    _issue_cache[key] = (_file_sig(st), issue)
+    return issue.model_copy(deep=True)
 
 
-def save_issue(repo_dir: Path, issue_id: int, issue: IssueFile) -> Path:
-    """Write issue to .coddy/issues/{issue_id}.yaml.
-
-    Creates dir if needed.
-    """
-    path = _issue_path(repo_dir, issue_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = issue.model_dump(mode="json", exclude_none=True)
+def _issue_payload(issue: IssueFile, issue_id: int) -> dict:
+    """Dict written to the issue file (unset optional fields omitted)."""
+    # Every field is already a YAML-native primitive, so skip the JSON-mode coercion pass
+    payload = issue.model_dump(mode="python", exclude_none=True)
     if payload.get("assigned_at") is None:
         payload.pop("assigned_at", None)
     if payload.get("assigned_to") is None or payload.get("assigned_to") == "":
@@ -61,14 +164,38 @@ def save_issue(repo_dir: Path, issue_id: int, issue: IssueFile) -> Path:
             comment.pop("deleted_at", None)
     if issue.issue_id is None:
         payload["issue_id"] = issue_id
-    raw = yaml.dump(
-        payload,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-        width=1000,
-    )
-    path.write_text(raw, encoding="utf-8")
+    return payload
+
+
+def _unchanged_on_disk(key: str, issue_id: int, payload: dict) -> bool:
+    """True when the file is unchanged since it was cached and holds the same payload."""
+    cached = _issue_cache.get(key)
+    if cached is None:
+        return False
+    try:
+        st = os.stat(key)
+    except OSError:
+        return False
+    if cached[0] != _file_sig(st):
+        return False
+    return _issue_payload(cached[1], issue_id) == payload
+
+
+def save_issue(repo_dir: Path, issue_id: int, issue: IssueFile) -> Path:
+    """Write issue to .coddy/issues/{issue_id}.yaml.
+
+    Creates dir if needed. The write is skipped when the file already holds
+    the same content (e.g. repeated webhooks within the same second).
+    """
+    path = _issue_path(repo_dir, issue_id)
+    payload = _issue_payload(issue, issue_id)
+    if _unchanged_on_disk(os.fspath(path), issue_id, payload):
+        LOG.debug("Issue #%s unchanged, skipping write", issue_id)
+        return path
+    _atomic_write(path, _yaml_dump(payload))
+    # Write-through: next load_issue of this file is a cache hit
+    st = path.stat()
+    _issue_cache[os.fspath(path)] = (_file_sig(st), _construct_trusted(payload))
     LOG.debug("Saved issue #%s to %s", issue_id, path)
     return path
 
@@ -90,7 +217,7 @@ def create_issue(
     comments is empty by default (title/description are separate fields).
     All date fields are Unix timestamps. assigned_at/assigned_to omitted when not assigned.
     """
-    now_ts = int(datetime.now(UTC).timestamp())
+    now_ts = _now_ts()
     created = created_at if created_at is not None else now_ts
     updated = updated_at if updated_at is not None else now_ts
     issue = IssueFile(
@@ -125,7 +252,7 @@ def add_comment(
     if not issue:
         LOG.warning("Cannot add comment: issue #%s not found", issue_id)
         return
-    now_ts = int(datetime.now(UTC).timestamp())
+    now_ts = _now_ts()
     ts_created = created_at if created_at is not None else now_ts
     ts_updated = updated_at if updated_at is not None else now_ts
     issue.comments.append(
@@ -153,7 +280,7 @@ def update_comment(
     issue = load_issue(repo_dir, issue_id)
     if not issue:
         return False
-    now_ts = int(datetime.now(UTC).timestamp())
+    now_ts = _now_ts()
     ts_updated = updated_at if updated_at is not None else now_ts
     for c in issue.comments:
         if c.comment_id == comment_id:
@@ -171,7 +298,7 @@ def delete_comment(repo_dir: Path, issue_id: int, comment_id: int, deleted_at: i
     issue = load_issue(repo_dir, issue_id)
     if not issue:
         return False
-    now_ts = int(datetime.now(UTC).timestamp())
+    now_ts = _now_ts()
     ts = deleted_at if deleted_at is not None else now_ts
     for c in issue.comments:
         if c.comment_id == comment_id:
@@ -190,31 +317,100 @@ def set_issue_status(repo_dir: Path, issue_id: int, status: str) -> None:
         LOG.warning("Cannot set status: issue #%s not found", issue_id)
         return
     issue.status = status
-    issue.updated_at = int(datetime.now(UTC).timestamp())
+    issue.updated_at = _now_ts()
     save_issue(repo_dir, issue_id, issue)
     LOG.info("Issue #%s status -> %s", issue_id, status)
 
 
-def list_issues_by_status(repo_dir: Path, status: str) -> list[tuple[int, IssueFile]]:
-    """List all issues with the given status.
+def _issue_ids(base: Path) -> list[int]:
+    """Issue ids with a {id}.yaml entry in base, in ascending numeric order.
 
-    Returns list of (issue_id, IssueFile).
+    Adding, removing or replacing a file (save_issue replaces) bumps the dir
+    mtime, so an unchanged dir reuses the previous listing.
     """
-    base = _issues_dir(repo_dir)
-    if not base.is_dir():
+    key = os.fspath(base)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        _dir_cache.pop(key, None)
         return []
-    out = []
-    for f in base.glob("*.yaml"):
-        if not f.stem.isdigit():
-            continue
+    cached = _dir_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    ids = []
+    try:
+        with os.scandir(key) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".yaml"):
+                    continue
+                stem = name[: -len(".yaml")]
+                if stem.isdigit():
+                    ids.append(int(stem))
+    except OSError:
+        return []
+    ids.sort()
+    if time.time_ns() - mtime_ns > _RACY_NS:
+        _dir_cache[key] = (mtime_ns, ids)
+    return ids
+
+
+def _scan_candidates(repo_dir: Path, status: str) -> Iterator[int]:
+    """Yield issue ids whose file may have the given status.
+
+    Ids come from the (cached) dir listing; files whose cached or peeked
+    status differs are skipped without a full parse.
+    """
+    base = _issues_dir(repo_dir)
+    for n in _issue_ids(base):
+        path = os.fspath(base / f"{n}.yaml")
         try:
-            n = int(f.stem)
-            issue = load_issue(repo_dir, n)
-            if issue and issue.status == status:
-                out.append((n, issue))
-        except (ValueError, Exception):
+            st = os.stat(path)
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
             continue
-    return out
+        peeked = _cached_status(path, st) or _peek_status(path)
+        if peeked is not None and peeked != status:
+            continue
+        yield n
+
+
+def _load_or_none(repo_dir: Path, issue_id: int) -> IssueFile | None:
+    """load_issue for listings: any error skips the file."""
+    try:
+        return load_issue(repo_dir, issue_id)
+    except Exception:
+        return None
+
+
+def iter_issues_by_status(repo_dir: Path, status: str) -> Iterator[tuple[int, IssueFile]]:
+    """Yield (issue_id, IssueFile) for issues with the given status, lazily,
+    lowest issue id first.
+
+    Files whose status does not match are skipped before the full YAML
+    parse and validation, so a caller that stops early (e.g. next(...))
+    does not touch the remaining files.
+    """
+    for n in _scan_candidates(repo_dir, status):
+        issue = _load_or_none(repo_dir, n)
+        if issue and issue.status == status:
+            yield n, issue
+
+
+def list_issues_by_status(repo_dir: Path, status: str) -> list[tuple[int, IssueFile]]:
+    """List all issues with the given status.
+
+    Several candidate files are loaded on a shared bounded thread pool
+    (_IO_POOL), which overlaps file reads on slow or network filesystems.
+    Returns list of (issue_id, IssueFile) sorted by issue id.
+    """
+    candidates = list(_scan_candidates(repo_dir, status))
+    if len(candidates) > 1:
+        loaded = list(_IO_POOL.map(_load_or_none, [repo_dir] * len(candidates), candidates))
+    else:
+        loaded = [_load_or_none(repo_dir, n) for n in candidates]
+    return [(n, issue) for n, issue in zip(candidates, loaded) if issue and issue.status == status]
 
 
 def list_queued(repo_dir: Path) -> list[tuple[int, IssueFile]]:
@@ -4,22 +4,30 @@ One file per PR: {pr_id}.yaml. Status is updated in place (open, merged, closed)
 """
 
 import logging
+import os
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+from coddy.services.store._io import _atomic_write, _file_sig, _read_bytes, _yaml_dump, _yaml_load
 from coddy.services.store.schemas import PRFile
 
 PRS_DIR = ".coddy/prs"
 
 LOG = logging.getLogger("coddy.services.store.pr_store")
 
+# Parsed PR files: path -> (_file_sig, PRFile)
+_pr_cache: dict[str, tuple[tuple[int, int, int], PRFile]] = {}
 
+
+@lru_cache(maxsize=32)
 def _prs_dir(repo_dir: Path) -> Path:
     return Path(repo_dir) / PRS_DIR
 
 
+@lru_cache(maxsize=1024)
 def _pr_path(repo_dir: Path, pr_id: int) -> Path:
     return _prs_dir(repo_dir) / f"{pr_id}.yaml"
 
@@ -27,19 +35,30 @@ def _pr_path(repo_dir: Path, pr_id: int) -> Path:
 def load_pr(repo_dir: Path, pr_id: int) -> PRFile | None:
     """Load PR from .coddy/prs/{pr_id}.yaml.
 
-    Returns None if missing or invalid.
+    Parsed PRs are cached by file (mtime_ns, size, inode); an unchanged file is
+    returned from the cache without reading it. Returns None if missing or
+    invalid.
     """
     path = _pr_path(repo_dir, pr_id)
-    if not path.is_file():
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _pr_cache.pop(key, None)
         return None
+    cached = _pr_cache.get(key)
+    if cached is not None and cached[0] == _file_sig(st):
+        return cached[1].model_copy()
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = _yaml_load(_read_bytes(key))
         if not data:
             return None
-        return PRFile.model_validate(data)
+        pr = PRFile.model_validate(data)
     except (OSError, yaml.YAMLError, Exception) as e:
         LOG.warning("Failed to load PR %s: %s", pr_id, e)
         return None
+    _pr_cache[key] = (_file_sig(st), pr)
+    return pr.model_copy()
 
 
 def save_pr(repo_dir: Path, pr: PRFile) -> Path:
@@ -48,16 +67,10 @@ def save_pr(repo_dir: Path, pr: PRFile) -> Path:
     Creates dir if needed.
     """
     path = _pr_path(repo_dir, pr.pr_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
     payload = pr.model_dump(mode="json", exclude_none=True)
-    raw = yaml.dump(
-        payload,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-        width=1000,
-    )
-    path.write_text(raw, encoding="utf-8")
+    _atomic_write(path, _yaml_dump(payload))
+    st = path.stat()
+    _pr_cache[os.fspath(path)] = (_file_sig(st), pr.model_copy())
     LOG.debug("Saved PR #%s to %s", pr.pr_id, path)
     return path
 
@@ -69,9 +82,21 @@ def set_pr_status(
     repo: str | None = None,
     issue_number: int | None = None,
 ) -> None:
-    """Create or update PR file with given status (open, merged, closed)."""
-    now = datetime.now(UTC).isoformat()
+    """Create or update PR file with given status (open, merged, closed).
+
+    An existing record that already has this status, repo and issue is left
+    untouched (e.g. repeated or retried webhooks).
+    """
     pr = load_pr(repo_dir, pr_id)
+    if (
+        pr
+        and pr.status == status
+        and (not repo or pr.repo == repo)
+        and (issue_number is None or pr.issue_id == issue_number)
+    ):
+        LOG.debug("PR #%s already %s, skipping write", pr_id, status)
+        return
+    now = datetime.now(UTC).isoformat()
     if pr:
         pr.status = status
         pr.updated_at = now
@@ -60,22 +60,21 @@ class IssueFile(BaseModel):
 
     def to_markdown(self) -> str:
         """Render issue as markdown (title, description, comments thread)."""
-        lines = []
+        lines: List[str] = []
         if self.issue_id is not None:
-            lines.append(f"# Issue {self.issue_id}")
-            lines.append("")
-        lines.append("## Title")
-        lines.append(self.title or "(no title)")
-        lines.append("")
-        lines.append("## Description")
-        lines.append(self.description or "(no description)")
-        lines.append("")
+            lines.extend((f"# Issue {self.issue_id}", ""))
+        lines.extend(
+            (
+                "## Title",
+                self.title or "(no title)",
+                "",
+                "## Description",
+                self.description or "(no description)",
+                "",
+            )
+        )
         if self.comments:
-            lines.append("## Comments")
-            lines.append("")
+            lines.extend(("## Comments", ""))
             for msg in self.comments:
-                lines.append(f"### {msg.name}")
-                lines.append("")
-                lines.append(msg.content)
-                lines.append("")
+                lines.extend((f"### {msg.name}", "", msg.content, ""))
         return "\n".join(lines).strip() + "\n"
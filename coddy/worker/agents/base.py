@@ -1,6 +1,7 @@
 """Abstract base for AI agents (sufficiency check, code generation, review
 feedback)."""
 
+import asyncio
 from pathlib import Path
 from typing import List
 
@@ -49,6 +50,22 @@ class AIAgent:
         """
         raise NotImplementedError
 
+    async def agenerate_plan(self, issue: Issue, comments: List[Comment]) -> str:
+        """Async variant of generate_plan.
+
+        Default runs generate_plan in a worker thread; override for
+        native async.
+        """
+        return await asyncio.to_thread(self.generate_plan, issue, comments)
+
+    async def agenerate_code(self, issue: Issue, comments: List[Comment]) -> str | None:
+        """Async variant of generate_code.
+
+        Default runs generate_code in a worker thread; override for
+        native async.
+        """
+        return await asyncio.to_thread(self.generate_code, issue, comments)
+
     def process_review_item(
         self,
         pr_number: int,
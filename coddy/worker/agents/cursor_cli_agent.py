@@ -7,6 +7,7 @@ agent_clarification to the task YAML and stops; Coddy reads that
 and posts it to the issue. Run log is in .coddy/task-{n}.log.
 """
 
+import asyncio
 import logging
 import os
 import subprocess
@@ -26,6 +27,14 @@ from coddy.worker.task_yaml import (
     write_task_file,
 )
 
+# Fallback plan when the CLI fails or prints nothing
+DEFAULT_PLAN = "1. Analyze issue\n2. Implement\n3. Test"
+
+LOG_SEPARATOR = "-" * 60 + "\n"
+
+# Minimal issue body length (after strip) considered sufficient to implement
+MIN_BODY_LENGTH = 20
+
 
 class CursorCLIAgent(AIAgent):
     """Run Cursor CLI in headless mode (-p --force) with task YAML context.
@@ -56,25 +65,48 @@ class CursorCLIAgent(AIAgent):
         self.model = model
         self.mode = mode
         self._log = log or logging.getLogger("coddy.worker.agents.cursor_cli")
+        # Static argv prefixes built once; per-call only the prompt is appended
+        plan_cmd = [command, "-p", "--force"]
+        if output_format:
+            plan_cmd.extend(["--output-format", output_format])
+        if model:
+            plan_cmd.extend(["--model", model])
+        self._plan_cmd: tuple[str, ...] = tuple(plan_cmd)
+        run_cmd = [command, "-p", "--force"]
+        if output_format:
+            run_cmd.extend(["--output-format", output_format])
+        if stream_partial_output:
+            run_cmd.append("--stream-partial-output")
+        if model:
+            run_cmd.extend(["--model", model])
+        if mode:
+            run_cmd.extend(["--mode", mode])
+        self._run_cmd: tuple[str, ...] = tuple(run_cmd)
+        self._env_overrides: dict[str, str] = {"CURSOR_API_KEY": token} if token else {}
 
-    def generate_plan(self, issue: Issue, comments: List[Comment]) -> str:
-        """Run Cursor CLI with a plan-only prompt; return plan text in issue
-        language."""
-        prompt = (
+    def _env(self) -> dict[str, str] | None:
+        """Return subprocess environment: current env plus agent overrides.
+
+        None (inherit parent env, no copy) when there is nothing to
+        override.
+        """
+        if not self._env_overrides:
+            return None
+        return os.environ | self._env_overrides
+
+    def _plan_prompt(self, issue: Issue) -> str:
+        return (
             f"You are a planner. The user created an issue. Output ONLY a short implementation plan "
             f"(bullet points, no code). Use the same language as the issue. "
             f"Issue title: {issue.title!r}\n\nBody:\n{issue.body or '(none)'}\n\n"
             "Output only the plan, nothing else."
         )
-        cmd = [self.command, "-p", "--force"]
-        if self.output_format:
-            cmd.extend(["--output-format", self.output_format])
-        if self.model:
-            cmd.extend(["--model", self.model])
-        cmd.append(prompt)
-        env = os.environ.copy()
-        if self.token:
-            env["CURSOR_API_KEY"] = self.token
+
+    def generate_plan(self, issue: Issue, comments: List[Comment]) -> str:
+        """Run Cursor CLI with a plan-only prompt; return plan text in issue
+        language."""
+        cmd = [*self._plan_cmd, self._plan_prompt(issue)]
+        env = self._env()
         try:
             result = subprocess.run(
                 cmd,
@@ -86,27 +118,53 @@ class CursorCLIAgent(AIAgent):
                 text=True,
             )
             out = (result.stdout or "") + (result.stderr or "")
-            return out.strip() or "1. Analyze issue\n2. Implement\n3. Test"
+            return out.strip() or DEFAULT_PLAN
         except (subprocess.TimeoutExpired, FileNotFoundError) as e:
             self._log.warning("Plan generation failed: %s", e)
-            return "1. Analyze issue\n2. Implement\n3. Test"
+            return DEFAULT_PLAN
+
+    async def agenerate_plan(self, issue: Issue, comments: List[Comment]) -> str:
+        """Async generate_plan: CLI runs via asyncio subprocess, event loop is
+        not blocked."""
+        cmd = [*self._plan_cmd, self._plan_prompt(issue)]
+        timeout = min(self.timeout, 120)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.working_directory,
+                env=self._env(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            self._log.warning("Plan generation failed: %s", e)
+            return DEFAULT_PLAN
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            self._log.warning("Plan generation failed: timed out after %s seconds", timeout)
+            return DEFAULT_PLAN
+        out = (stdout or b"").decode("utf-8", "replace") + (stderr or b"").decode("utf-8", "replace")
+        return out.strip() or DEFAULT_PLAN
 
     def evaluate_sufficiency(self, issue: Issue, comments: List[Comment]) -> SufficiencyResult:
         """Use simple heuristic: sufficient if body has some content."""
-        if len((issue.body or "").strip()) < 20:
+        body = issue.body or ""
+        # Strip (and its copy) is only needed when the body has whitespace at the edges
+        if len(body) >= MIN_BODY_LENGTH and not body[0].isspace() and not body[-1].isspace():
+            return SufficiencyResult(sufficient=True)
+        if len(body.strip()) < MIN_BODY_LENGTH:
             return SufficiencyResult(
                 sufficient=False,
                 clarification=("Please add more details: what should be implemented and acceptance criteria."),
             )
         return SufficiencyResult(sufficient=True)
 
-    def generate_code(self, issue: Issue, comments: List[Comment]) -> str | None:
-        """Write task YAML, run Cursor CLI headless, read PR report.
-
-        All run info and CLI stdout/stderr are written to
-        .coddy/task-{issue}.log. Returns PR description string for
-        create_pr, or None if report missing.
-        """
+    def _prepare_code_run(self, issue: Issue, comments: List[Comment]) -> tuple[Path, Path, Path, list[str]]:
+        """Write task YAML and return (repo_dir, report_path, log_path, cmd);
+        log is created with the run header."""
         repo_dir = Path(self.working_directory).resolve()
         task_path = write_task_file(issue, comments, repo_dir)
         report_path = report_file_path(repo_dir, issue.number)
@@ -118,53 +176,96 @@ class CursorCLIAgent(AIAgent):
             f"If data is insufficient, add the key 'agent_clarification' to that YAML with your question and stop. "
             f"Otherwise implement and write the PR description to {report_path} (YAML with key 'body')."
         )
+        # Header goes out in a single write before the CLI appends to the log
+        header = (
+            f"[{datetime.now(UTC).isoformat()}] Issue #{issue.number} | "
+            f"command={self.command} timeout={self.timeout}s\n"
+            f"Task file: {task_path}\n"
+            f"Report file: {report_path}\n" + LOG_SEPARATOR
+        )
+        self._write_log(log_path, header, truncate=True)
+        return repo_dir, report_path, log_path, [*self._run_cmd, prompt]
+
+    def _write_log(self, log_path: Path, text: str, truncate: bool = False) -> None:
+        """Write text to the task log. Every write (ours and the CLI's
+        redirected output) goes through a binary append handle, so the file
+        is only ever opened in one mode."""
+        with open(log_path, "wb" if truncate else "ab") as log_file:
+            log_file.write(text.encode("utf-8"))
+
+    def _append_log(self, log_path: Path, line: str) -> None:
+        self._write_log(log_path, f"{LOG_SEPARATOR}{line}\n")
 
-        cmd = [self.command, "-p", "--force"]
-        if self.output_format:
-            cmd.extend(["--output-format", self.output_format])
-        if self.stream_partial_output:
-            cmd.append("--stream-partial-output")
-        if self.model:
-            cmd.extend(["--model", self.model])
-        if self.mode:
-            cmd.extend(["--mode", self.mode])
-        cmd.append(prompt)
-        env = os.environ.copy()
-        if self.token:
-            env["CURSOR_API_KEY"] = self.token
+    def _run_to_log(self, cmd: list[str], log_path: Path) -> int:
+        """Run the CLI with stdout/stderr redirected to the log file; return
+        exit code.
+
+        The child writes straight to the log file descriptor (opened in
+        binary append mode), so output never passes through this process.
+        Raises subprocess.TimeoutExpired or FileNotFoundError.
+        """
+        with open(log_path, "ab") as log_file:
+            result = subprocess.run(
+                cmd,
+                cwd=self.working_directory,
+                env=self._env(),
+                timeout=self.timeout,
+                check=False,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        return result.returncode
+
+    def generate_code(self, issue: Issue, comments: List[Comment]) -> str | None:
+        """Write task YAML, run Cursor CLI headless, read PR report.
+
+        All run info and CLI stdout/stderr are written to
+        .coddy/task-{issue}.log. Returns PR description string for
+        create_pr, or None if report missing.
+        """
+        repo_dir, _, log_path, cmd = self._prepare_code_run(issue, comments)
 
         self._log.info("Running Cursor CLI (headless): %s (timeout=%ss)", self.command, self.timeout)
         try:
-            with open(log_path, "w", encoding="utf-8") as log_file:
-                log_file.write(
-                    f"[{datetime.now(UTC).isoformat()}] Issue #{issue.number} | "
-                    f"command={self.command} timeout={self.timeout}s\n"
-                )
-                log_file.write(f"Task file: {task_path}\n")
-                log_file.write(f"Report file: {report_path}\n")
-                log_file.write("-" * 60 + "\n")
-                log_file.flush()
-                result = subprocess.run(
-                    cmd,
+            returncode = self._run_to_log(cmd, log_path)
+            self._append_log(log_path, f"Exit code: {returncode}")
+        except subprocess.TimeoutExpired:
+            self._append_log(log_path, f"Timed out after {self.timeout}s")
+            self._log.warning("Cursor CLI timed out after %s seconds", self.timeout)
+        except FileNotFoundError as e:
+            self._append_log(log_path, f"Error: CLI not found: {e}")
+            self._log.warning("Cursor CLI not found: %s", e)
+            return None
+
+        return read_pr_report(repo_dir, issue.number) or None
+
+    async def agenerate_code(self, issue: Issue, comments: List[Comment]) -> str | None:
+        """Async generate_code: CLI output goes straight to the task log while
+        the event loop stays free; the process is killed on timeout."""
+        repo_dir, _, log_path, cmd = self._prepare_code_run(issue, comments)
+
+        self._log.info("Running Cursor CLI (headless, async): %s (timeout=%ss)", self.command, self.timeout)
+        try:
+            with open(log_path, "ab") as log_file:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
                     cwd=self.working_directory,
-                    env=env,
-                    timeout=self.timeout,
-                    check=False,
+                    env=self._env(),
                     stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    text=True,
+                    stderr=asyncio.subprocess.STDOUT,
                 )
-                log_file.write("-" * 60 + "\n")
-                log_file.write(f"Exit code: {result.returncode}\n")
-        except subprocess.TimeoutExpired:
-            with open(log_path, "a", encoding="utf-8") as log_file:
-                log_file.write("-" * 60 + "\n")
-                log_file.write(f"Timed out after {self.timeout}s\n")
+                try:
+                    returncode = await asyncio.wait_for(proc.wait(), timeout=self.timeout)
+                except TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+            self._append_log(log_path, f"Exit code: {returncode}")
+        except TimeoutError:
+            self._append_log(log_path, f"Timed out after {self.timeout}s")
             self._log.warning("Cursor CLI timed out after %s seconds", self.timeout)
         except FileNotFoundError as e:
-            with open(log_path, "a", encoding="utf-8") as log_file:
-                log_file.write("-" * 60 + "\n")
-                log_file.write(f"Error: CLI not found: {e}\n")
+            self._append_log(log_path, f"Error: CLI not found: {e}")
             self._log.warning("Cursor CLI not found: %s", e)
             return None
 
@@ -195,19 +296,7 @@ class CursorCLIAgent(AIAgent):
             f"Address the current item only: apply code changes and/or write your reply to "
             f"{reply_path} (YAML with key 'body'). Then stop."
         )
-        cmd = [self.command, "-p", "--force"]
-        if self.output_format:
-            cmd.extend(["--output-format", self.output_format])
-        if self.stream_partial_output:
-            cmd.append("--stream-partial-output")
-        if self.model:
-            cmd.extend(["--model", self.model])
-        if self.mode:
-            cmd.extend(["--mode", self.mode])
-        cmd.append(prompt)
-        env = os.environ.copy()
-        if self.token:
-            env["CURSOR_API_KEY"] = self.token
+        cmd = [*self._run_cmd, prompt]
 
         self._log.info(
             "Running Cursor CLI for review item %s/%s (timeout=%ss)",
@@ -216,26 +305,15 @@ class CursorCLIAgent(AIAgent):
             self.timeout,
         )
         try:
-            with open(log_path, "a", encoding="utf-8") as log_file:
-                log_file.write(f"[{datetime.now(UTC).isoformat()}] PR #{pr_number} review item {current_index}\n")
-                log_file.write(f"Task file: {task_path}\n")
-                log_file.write("-" * 60 + "\n")
-                log_file.flush()
-                result = subprocess.run(
-                    cmd,
-                    cwd=self.working_directory,
-                    env=env,
-                    timeout=self.timeout,
-                    check=False,
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                )
-                log_file.write("-" * 60 + "\n")
-                log_file.write(f"Exit code: {result.returncode}\n")
+            self._write_log(
+                log_path,
+                f"[{datetime.now(UTC).isoformat()}] PR #{pr_number} review item {current_index}\n"
+                f"Task file: {task_path}\n" + LOG_SEPARATOR,
+            )
+            returncode = self._run_to_log(cmd, log_path)
+            self._append_log(log_path, f"Exit code: {returncode}")
         except subprocess.TimeoutExpired:
-            with open(log_path, "a", encoding="utf-8") as log_file:
-                log_file.write(f"Timed out after {self.timeout}s\n")
+            self._append_log(log_path, f"Timed out after {self.timeout}s")
             self._log.warning("Cursor CLI timed out after %s seconds", self.timeout)
             return None
         except FileNotFoundError as e:
@@ -90,8 +90,7 @@ def run_ralph_loop_for_issue(
 
     for iteration in range(1, max_iterations + 1):
         logger.info("Issue #%s: ralph iteration %s/%s", issue.number, iteration, max_iterations)
-        issue = adapter.get_issue(repo, issue.number)
-        comments = adapter.get_issue_comments(repo, issue.number, since=None)
+        issue, comments = adapter.fetch_issue_bundle(repo, issue.number)
 
         pr_body = agent.generate_code(issue, comments)
 
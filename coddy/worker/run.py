@@ -14,7 +14,7 @@ import yaml
 
 from coddy.config import AppConfig, LoggingConfig, load_config
 from coddy.logging import CoddyLogging
-from coddy.services.store import list_queued, set_issue_status
+from coddy.services.store import IssueFile, iter_issues_by_status, set_issue_status
 from coddy.worker.task_yaml import report_file_path
 
 
@@ -66,30 +66,35 @@ def run_worker(config: AppConfig, once: bool = False, poll_interval: int = 10) -
     log.info("Coddy worker started (dry run) | repo=%s | workspace=%s | once=%s", repo, repo_dir, once)
 
     while True:
-        queued = list_queued(repo_dir)
-        if not queued:
+        # Drain every issue queued at scan time (lowest id first) before
+        # rescanning; files are loaded lazily, one at a time
+        processed = 0
+        for issue_number, issue_file in iter_issues_by_status(repo_dir, "queued"):
+            _process_issue(repo_dir, issue_number, issue_file, log)
+            processed += 1
             if once:
-                log.info("No queued issues, exiting (--once)")
                 return
-            time.sleep(poll_interval)
+        if processed:
             continue
+        if once:
+            log.info("No queued issues, exiting (--once)")
+            return
+        time.sleep(poll_interval)
 
-        queued.sort(key=lambda t: t[0])
-        issue_number, issue_file = queued[0]
-        log.info("Dry run: processing issue #%s (%s)", issue_number, issue_file.title or "")
 
-        report_path = report_file_path(repo_dir, issue_number)
-        report_path.parent.mkdir(parents=True, exist_ok=True)
-        body = "# Dry run\n\nNo implementation yet; worker is a stub."
-        report_path.write_text(
-            yaml.dump({"body": body}, default_flow_style=False, allow_unicode=True, sort_keys=False),
-            encoding="utf-8",
-        )
-        set_issue_status(repo_dir, issue_number, "done")
-        log.info("Dry run: wrote empty PR YAML for issue #%s -> %s", issue_number, report_path.name)
+def _process_issue(repo_dir: Path, issue_number: int, issue_file: IssueFile, log: logging.Logger) -> None:
+    """Dry run for one queued issue: write empty PR YAML, set status done."""
+    log.info("Dry run: processing issue #%s (%s)", issue_number, issue_file.title or "")
 
-        if once:
-            return
+    report_path = report_file_path(repo_dir, issue_number)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    body = "# Dry run\n\nNo implementation yet; worker is a stub."
+    report_path.write_text(
+        yaml.dump({"body": body}, default_flow_style=False, allow_unicode=True, sort_keys=False),
+        encoding="utf-8",
+    )
+    set_issue_status(repo_dir, issue_number, "done")
+    log.info("Dry run: wrote empty PR YAML for issue #%s -> %s", issue_number, report_path.name)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -78,8 +78,6 @@ def read_agent_clarification(repo_dir: Path, issue_number: int) -> str | None:
     """Read agent_clarification from .coddy/task-{issue_number}.yaml if
     present."""
     path = task_file_path(repo_dir, issue_number)
-    if not path.is_file():
-        return None
     try:
         data = yaml.safe_load(path.read_text(encoding="utf-8"))
         if not data or not isinstance(data, dict):
@@ -92,8 +90,6 @@ def read_agent_clarification(repo_dir: Path, issue_number: int) -> str | None:
 def read_pr_report(repo_dir: Path, issue_number: int) -> str:
     """Read PR description from .coddy/pr-{issue_number}.yaml if present."""
     path = report_file_path(repo_dir, issue_number)
-    if not path.is_file():
-        return ""
     try:
         data = yaml.safe_load(path.read_text(encoding="utf-8"))
         if not data or not isinstance(data, dict):
@@ -166,16 +162,17 @@ def write_review_task_file(
 def read_review_reply(repo_dir: Path, pr_number: int, comment_id: int) -> str | None:
     """Read the agent's reply for a review comment from the reply YAML."""
     path = review_reply_file_path(repo_dir, pr_number, comment_id)
-    if not path.is_file():
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
         return None
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        if not data or not isinstance(data, dict):
-            text = path.read_text(encoding="utf-8").strip()
-            return text or None
-        return (data.get("body") or "").strip() or None
-    except Exception:
-        try:
-            return path.read_text(encoding="utf-8").strip() or None
-        except Exception:
-            return None
+        data = yaml.safe_load(raw)
+    except yaml.YAMLError:
+        return raw.strip() or None
+    if not data or not isinstance(data, dict):
+        return raw.strip() or None
+    body = data.get("body") or ""
+    if not isinstance(body, str):
+        return raw.strip() or None
+    return body.strip() or None
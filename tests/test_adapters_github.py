@@ -1,5 +1,6 @@
 """Unit tests for GitHub adapter (mocked API)."""
 
+from typing import Any, Dict
 from unittest.mock import Mock, patch
 
 import pytest
@@ -14,6 +15,48 @@ def adapter() -> GitHubAdapter:
     return GitHubAdapter(token="test-token", api_url="https://api.github.com")
 
 
+def test_session_mounts_pooled_transport(adapter: GitHubAdapter) -> None:
+    """Adapter session reuses connections via a pooled HTTPAdapter with
+    retries."""
+    transport = adapter._session.get_adapter("https://api.github.com/repos/o/r")
+    assert transport._pool_maxsize == 32
+    assert transport.max_retries.total == 3
+    assert "GET" in transport.max_retries.allowed_methods
+    assert "POST" not in transport.max_retries.allowed_methods
+    assert adapter._session.headers["Authorization"] == "token test-token"
+
+
+def test_persistent_5xx_after_retries_raises_platform_error() -> None:
+    """A 5xx that outlasts the retries surfaces as GitPlatformError, not
+    requests' RetryError."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    hits: list[str] = []
+
+    class AlwaysBadGateway(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler API)
+            hits.append(self.path)
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), AlwaysBadGateway)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        adapter = GitHubAdapter(token="t", api_url=f"http://127.0.0.1:{httpd.server_address[1]}")
+        with patch("urllib3.util.retry.Retry.sleep"):
+            with pytest.raises(GitPlatformError, match="502"):
+                adapter.get_issue("owner/repo", 1)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert len(hits) == 4
+
+
 def test_get_issue_success(adapter: GitHubAdapter) -> None:
     """get_issue returns Issue when API returns 200."""
     response_data = {
@@ -71,6 +114,29 @@ def test_get_issue_api_error_raises(adapter: GitHubAdapter) -> None:
     assert "403" in str(exc_info.value) or "rate limit" in str(exc_info.value).lower()
 
 
+def test_get_issue_revalidates_with_etag(adapter: GitHubAdapter) -> None:
+    """Repeated get_issue sends If-None-Match and reuses the cached body on
+    304."""
+    first = Mock(status_code=200, headers={"ETag": 'W/"abc"'})
+    first.json.return_value = {
+        "number": 1,
+        "title": "Cached issue",
+        "state": "open",
+        "labels": [],
+        "created_at": "2024-01-15T10:00:00Z",
+        "updated_at": "2024-01-16T12:00:00Z",
+        "user": {"login": "octocat"},
+    }
+    not_modified = Mock(status_code=304, headers={})
+
+    with patch.object(adapter._session, "request", side_effect=[first, not_modified]) as req:
+        assert adapter.get_issue("owner/repo", 1).title == "Cached issue"
+        assert adapter.get_issue("owner/repo", 1).title == "Cached issue"
+
+    assert req.call_args_list[0][1]["headers"] is None
+    assert req.call_args_list[1][1]["headers"] == {"If-None-Match": 'W/"abc"'}
+
+
 def test_list_open_issues_returns_issues_only(adapter: GitHubAdapter) -> None:
     """list_open_issues returns only issues, excludes PRs."""
     response_data = [
@@ -98,6 +164,7 @@ def test_list_open_issues_returns_issues_only(adapter: GitHubAdapter) -> None:
     mock_resp = Mock()
     mock_resp.status_code = 200
     mock_resp.json.return_value = response_data
+    mock_resp.links = {}
 
     with patch.object(adapter._session, "request", return_value=mock_resp) as req:
         issues = adapter.list_open_issues("owner/repo")
@@ -116,6 +183,7 @@ def test_list_open_issues_empty(adapter: GitHubAdapter) -> None:
     mock_resp = Mock()
     mock_resp.status_code = 200
     mock_resp.json.return_value = []
+    mock_resp.links = {}
 
     with patch.object(adapter._session, "request", return_value=mock_resp):
         issues = adapter.list_open_issues("owner/repo")
@@ -173,6 +241,7 @@ def test_get_issue_comments_success(adapter: GitHubAdapter) -> None:
     mock_resp = Mock()
     mock_resp.status_code = 200
     mock_resp.json.return_value = response_data
+    mock_resp.links = {}
 
     with patch.object(adapter._session, "request", return_value=mock_resp) as req:
         comments = adapter.get_issue_comments("owner/repo", 1)
@@ -184,6 +253,166 @@ def test_get_issue_comments_success(adapter: GitHubAdapter) -> None:
     assert "/repos/owner/repo/issues/1/comments" in req.call_args[0][1]
 
 
+def test_get_issue_comments_follows_next_link(adapter: GitHubAdapter) -> None:
+    """get_issue_comments requests per_page=100 and follows Link rel=next."""
+    comment = {
+        "body": "Text",
+        "created_at": "2024-01-15T10:00:00Z",
+        "updated_at": "2024-01-15T10:00:00Z",
+        "user": {"login": "user1"},
+    }
+    next_url = "https://api.github.com/repositories/1/issues/1/comments?per_page=100&page=2"
+    first = Mock(status_code=200, links={"next": {"url": next_url}})
+    first.json.return_value = [{**comment, "id": 1}]
+    second = Mock(status_code=200, links={})
+    second.json.return_value = [{**comment, "id": 2}]
+
+    with patch.object(adapter._session, "request", side_effect=[first, second]) as req:
+        comments = adapter.get_issue_comments("owner/repo", 1)
+
+    assert [c.id for c in comments] == [1, 2]
+    assert req.call_args_list[0][1]["params"]["per_page"] == 100
+    assert req.call_args_list[1][0][1] == next_url
+
+
+def test_list_open_issues_fetches_remaining_pages_from_last_link(adapter: GitHubAdapter) -> None:
+    """list_open_issues fetches pages 2..N from Link rel=last and keeps page
+    order."""
+    issue = {
+        "title": "Issue",
+        "state": "open",
+        "labels": [],
+        "created_at": "2024-01-15T10:00:00Z",
+        "updated_at": "2024-01-16T12:00:00Z",
+        "user": {"login": "octocat"},
+    }
+    last_url = "https://api.github.com/repositories/1/issues?state=open&per_page=100&page=3"
+    first = Mock(status_code=200, links={"next": {"url": "unused"}, "last": {"url": last_url}})
+    first.json.return_value = [{**issue, "number": 1}]
+
+    def fake_request(method: str, url: str, **kwargs: object) -> Mock:
+        if "page=" not in url:
+            return first
+        page = int(url.rsplit("page=", 1)[1])
+        resp = Mock(status_code=200, links={})
+        resp.json.return_value = [{**issue, "number": page}]
+        return resp
+
+    with patch.object(adapter._session, "request", side_effect=fake_request) as req:
+        issues = adapter.list_open_issues("owner/repo")
+
+    assert [i.number for i in issues] == [1, 2, 3]
+    assert req.call_count == 3
+
+
+def test_fetch_issue_bundle_uses_single_graphql_request(adapter: GitHubAdapter) -> None:
+    """fetch_issue_bundle returns issue and comments from one GraphQL POST."""
+    mock_resp = Mock(status_code=200)
+    mock_resp.json.return_value = {
+        "data": {
+            "repository": {
+                "issue": {
+                    "number": 7,
+                    "title": "Bundle",
+                    "body": "Body",
+                    "state": "OPEN",
+                    "createdAt": "2024-01-15T10:00:00Z",
+                    "updatedAt": "2024-01-16T12:00:00Z",
+                    "author": {"login": "octocat"},
+                    "labels": {"nodes": [{"name": "bug"}]},
+                    "comments": {
+                        "pageInfo": {"hasNextPage": False},
+                        "nodes": [
+                            {
+                                "databaseId": 101,
+                                "body": "First",
+                                "createdAt": "2024-01-15T11:00:00Z",
+                                "updatedAt": "2024-01-15T11:00:00Z",
+                                "author": {"login": "user1"},
+                            }
+                        ],
+                    },
+                }
+            }
+        }
+    }
+
+    with patch.object(adapter._session, "request", return_value=mock_resp) as req:
+        issue, comments = adapter.fetch_issue_bundle("owner/repo", 7)
+
+    req.assert_called_once()
+    assert req.call_args[0][:2] == ("POST", "https://api.github.com/graphql")
+    assert req.call_args[1]["json"]["variables"] == {"owner": "owner", "name": "repo", "number": 7}
+    assert isinstance(issue, Issue)
+    assert issue.number == 7
+    assert issue.state == "open"
+    assert issue.labels == ["bug"]
+    assert issue.author == "octocat"
+    assert [(c.id, c.author, c.body) for c in comments] == [(101, "user1", "First")]
+
+
+def test_fetch_issue_bundle_pages_comments_after_cursor(adapter: GitHubAdapter) -> None:
+    """More than one page of comments is fetched with comments(after:)
+    until hasNextPage is false."""
+
+    def comment(n: int) -> Dict[str, Any]:
+        ts = "2024-01-15T11:00:00Z"
+        return {"databaseId": n, "body": f"c{n}", "createdAt": ts, "updatedAt": ts, "author": {"login": "u"}}
+
+    first = Mock(status_code=200)
+    first.json.return_value = {
+        "data": {
+            "repository": {
+                "issue": {
+                    "number": 7,
+                    "title": "Long",
+                    "body": "",
+                    "state": "OPEN",
+                    "createdAt": "2024-01-15T10:00:00Z",
+                    "updatedAt": "2024-01-16T12:00:00Z",
+                    "author": {"login": "octocat"},
+                    "labels": {"nodes": []},
+                    "comments": {"pageInfo": {"hasNextPage": True, "endCursor": "c1"}, "nodes": [comment(1)]},
+                }
+            }
+        }
+    }
+    second = Mock(status_code=200)
+    second.json.return_value = {
+        "data": {
+            "repository": {
+                "issue": {"comments": {"pageInfo": {"hasNextPage": True, "endCursor": "c2"}, "nodes": [comment(2)]}}
+            }
+        }
+    }
+    third = Mock(status_code=200)
+    third.json.return_value = {
+        "data": {
+            "repository": {
+                "issue": {"comments": {"pageInfo": {"hasNextPage": False, "endCursor": "c3"}, "nodes": [comment(3)]}}
+            }
+        }
+    }
+
+    with patch.object(adapter._session, "request", side_effect=[first, second, third]) as req:
+        _, comments = adapter.fetch_issue_bundle("owner/repo", 7)
+
+    assert [c.id for c in comments] == [1, 2, 3]
+    assert req.call_count == 3
+    assert all(call[0][:2] == ("POST", "https://api.github.com/graphql") for call in req.call_args_list)
+    assert [call[1]["json"]["variables"].get("after") for call in req.call_args_list] == [None, "c1", "c2"]
+
+
+def test_fetch_issue_bundle_graphql_errors_raise(adapter: GitHubAdapter) -> None:
+    """GraphQL errors in a 200 response raise GitPlatformError."""
+    mock_resp = Mock(status_code=200)
+    mock_resp.json.return_value = {"data": None, "errors": [{"message": "Could not resolve to a Repository"}]}
+
+    with patch.object(adapter._session, "request", return_value=mock_resp):
+        with pytest.raises(GitPlatformError, match="Could not resolve"):
+            adapter.fetch_issue_bundle("owner/missing", 1)
+
+
 def test_create_branch_success(adapter: GitHubAdapter) -> None:
     """create_branch GETs repo and default ref then POSTs new ref."""
     repo_data = {"default_branch": "main"}
@@ -315,6 +544,7 @@ def test_list_pr_review_comments_success(adapter: GitHubAdapter) -> None:
     mock_resp = Mock()
     mock_resp.status_code = 200
     mock_resp.json.return_value = response_data
+    mock_resp.links = {}
     with patch.object(adapter._session, "request", return_value=mock_resp) as req:
         comments = adapter.list_pr_review_comments("owner/repo", 3)
     assert len(comments) == 1
@@ -1,12 +1,13 @@
 """Tests for CursorCLIAgent (headless mode, task/report/log files)."""
 
+import asyncio
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from coddy.observer.models import Issue
-from coddy.worker.agents.cursor_cli_agent import CursorCLIAgent
+from coddy.observer.models import Issue, ReviewComment
+from coddy.worker.agents.cursor_cli_agent import LOG_SEPARATOR, CursorCLIAgent
 
 
 def _issue(number: int = 42, body: str = "Enough body for sufficiency check.") -> Issue:
@@ -69,6 +70,31 @@ def test_cursor_cli_agent_log_file_on_timeout(tmp_path: Path) -> None:
     assert "Timed out after 60s" in content
 
 
+def test_cursor_cli_agent_review_item_timeout_is_logged_like_other_trailers(tmp_path: Path) -> None:
+    """On review item timeout, the message is appended after a separator."""
+    comment = ReviewComment(
+        id=5,
+        body="Fix typo",
+        author="user",
+        path="a.py",
+        line=1,
+        side="RIGHT",
+        created_at=datetime.now(UTC),
+        updated_at=None,
+        in_reply_to_id=None,
+    )
+    with patch(
+        "coddy.worker.agents.cursor_cli_agent.subprocess.run",
+        side_effect=subprocess.TimeoutExpired("agent", 60),
+    ):
+        agent = CursorCLIAgent(command="agent", timeout=60, working_directory=str(tmp_path))
+        result = agent.process_review_item(3, 8, [comment], 1, tmp_path)
+    assert result is None
+    content = (tmp_path / ".coddy" / "task-8.log").read_text(encoding="utf-8")
+    assert "PR #3 review item 1" in content
+    assert content.endswith(f"{LOG_SEPARATOR}Timed out after 60s\n")
+
+
 def test_cursor_cli_agent_log_file_on_cli_not_found(tmp_path: Path) -> None:
     """On FileNotFoundError, log file is appended with error."""
     with patch("coddy.worker.agents.cursor_cli_agent.subprocess.run", side_effect=FileNotFoundError("agent not found")):
@@ -116,3 +142,62 @@ def test_cursor_cli_agent_passes_cli_params_to_subprocess(tmp_path: Path) -> Non
     assert cmd[cmd.index("--model") + 1] == "Claude 4 Sonnet"
     assert "--mode" in cmd
     assert cmd[cmd.index("--mode") + 1] == "plan"
+
+
+def _fake_cli(tmp_path: Path, script: str) -> str:
+    path = tmp_path / "fake-agent"
+    path.write_text(f"#!/bin/sh\n{script}\n", encoding="utf-8")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_cursor_cli_agent_agenerate_code_streams_output_to_log(tmp_path: Path) -> None:
+    """agenerate_code runs the CLI as an asyncio subprocess with output in the
+    task log."""
+    agent = CursorCLIAgent(
+        command=_fake_cli(tmp_path, "echo agent-output"),
+        timeout=30,
+        working_directory=str(tmp_path),
+    )
+    with patch("coddy.worker.agents.cursor_cli_agent.read_pr_report", return_value="PR description"):
+        result = asyncio.run(agent.agenerate_code(_issue(number=11), []))
+    assert result == "PR description"
+    content = (tmp_path / ".coddy" / "task-11.log").read_text(encoding="utf-8")
+    assert "Issue #11" in content
+    assert "agent-output" in content
+    assert "Exit code: 0" in content
+
+
+def test_cursor_cli_agent_agenerate_code_kills_on_timeout(tmp_path: Path) -> None:
+    """agenerate_code kills the CLI after timeout and logs it."""
+    agent = CursorCLIAgent(
+        command=_fake_cli(tmp_path, "sleep 10"),
+        timeout=1,
+        working_directory=str(tmp_path),
+    )
+    with patch("coddy.worker.agents.cursor_cli_agent.read_pr_report", return_value=""):
+        result = asyncio.run(agent.agenerate_code(_issue(number=12), []))
+    assert result is None
+    content = (tmp_path / ".coddy" / "task-12.log").read_text(encoding="utf-8")
+    assert "Timed out after 1s" in content
+
+
+def test_cursor_cli_agent_evaluate_sufficiency_ignores_edge_whitespace() -> None:
+    """Body length is checked after strip; padded short bodies are
+    insufficient."""
+    agent = CursorCLIAgent()
+    assert agent.evaluate_sufficiency(_issue(body="Enough body for sufficiency check."), []).sufficient
+    assert agent.evaluate_sufficiency(_issue(body="  Enough body for sufficiency check.\n"), []).sufficient
+    assert not agent.evaluate_sufficiency(_issue(body="   short body      \n\n   "), []).sufficient
+    assert not agent.evaluate_sufficiency(_issue(body=""), []).sufficient
+
+
+def test_cursor_cli_agent_env_only_copied_when_token_set(tmp_path: Path) -> None:
+    """Without a token the CLI inherits the parent env; with a token
+    CURSOR_API_KEY is added."""
+    with patch("coddy.worker.agents.cursor_cli_agent.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout="plan", stderr="")
+        CursorCLIAgent(working_directory=str(tmp_path)).generate_plan(_issue(), [])
+        assert mock_run.call_args.kwargs["env"] is None
+        CursorCLIAgent(working_directory=str(tmp_path), token="secret").generate_plan(_issue(), [])
+        assert mock_run.call_args.kwargs["env"]["CURSOR_API_KEY"] == "secret"
@@ -0,0 +1,91 @@
+"""Tests for config loading."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from coddy.config import load_config
+
+
+def test_load_config_substitutes_env(tmp_path: Path) -> None:
+    """${VAR} and $VAR values are replaced from the environment."""
+    path = tmp_path / "config.yaml"
+    path.write_text("bot:\n  repository: ${CODDY_TEST_REPO}\n  name: $CODDY_TEST_NAME\n", encoding="utf-8")
+    with patch.dict(os.environ, {"CODDY_TEST_REPO": "owner/repo", "CODDY_TEST_NAME": "Bot"}):
+        config = load_config(path)
+    assert config.bot.repository == "owner/repo"
+    assert config.bot.name == "Bot"
+
+
+def test_load_config_returns_cached_config_for_unchanged_file(tmp_path: Path) -> None:
+    """Second call with same file and env reuses the cached AppConfig without
+    rebuilding it, but hands out an independent copy."""
+    from coddy import config as config_module
+
+    path = tmp_path / "config.yaml"
+    path.write_text("bot:\n  repository: owner/repo\n", encoding="utf-8")
+    with patch.object(config_module, "_build_config", wraps=config_module._build_config) as mock_build:
+        first = load_config(path)
+        first.bot.repository = "mutated/by-caller"
+        second = load_config(path)
+    mock_build.assert_called_once()
+    assert second is not first
+    assert second.bot.repository == "owner/repo"
+
+
+def test_load_config_reloads_when_file_or_env_changes(tmp_path: Path) -> None:
+    """Cache is bypassed when the file is rewritten or env differs."""
+    path = tmp_path / "config.yaml"
+    path.write_text("bot:\n  repository: owner/repo\n", encoding="utf-8")
+    first = load_config(path)
+    path.write_text("bot:\n  repository: owner/other-repo\n", encoding="utf-8")
+    second = load_config(path)
+    assert second.bot.repository == "owner/other-repo"
+    with patch.dict(os.environ, {"BOT_REPOSITORY": "env/repo"}):
+        third = load_config(path)
+    assert third.bot.repository == "env/repo"
+    assert first is not second and second is not third
+
+
+def test_substitute_env_returns_original_containers_without_refs() -> None:
+    """Subtrees without $ references are returned as-is (no copies)."""
+    from coddy import config as config_module
+
+    plain = {"name": "Bot", "labels": ["a", "b"]}
+    mixed = {"plain": plain, "token": "${CODDY_TEST_TOKEN}"}
+    with patch.object(config_module, "_current_env", {"CODDY_TEST_TOKEN": "secret"}):
+        assert config_module._substitute_env(plain) is plain
+        result = config_module._substitute_env(mixed)
+    assert result == {"plain": plain, "token": "secret"}
+    assert result["plain"] is plain
+    assert mixed["token"] == "${CODDY_TEST_TOKEN}"
+
+
+def test_load_config_reuses_config_when_content_unchanged(tmp_path: Path) -> None:
+    """Rewriting the file with identical bytes (new mtime) reuses the cached
+    AppConfig."""
+    from coddy import config as config_module
+
+    path = tmp_path / "config.yaml"
+    path.write_text("bot:\n  repository: owner/repo\n", encoding="utf-8")
+    first = load_config(path)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with patch.object(config_module, "_build_config") as mock_build:
+        assert load_config(path) == first
+    mock_build.assert_not_called()
+
+
+def test_resolved_secret_file_is_reread_after_rotation(tmp_path: Path) -> None:
+    """*_resolved properties re-read a Docker secret file on each access, so a
+    rotated secret is picked up by an already loaded AppConfig."""
+    secret = tmp_path / "token"
+    secret.write_text("file-token\n", encoding="utf-8")
+    path = tmp_path / "config.yaml"
+    path.write_text("bot:\n  repository: owner/repo\n", encoding="utf-8")
+    with patch.dict(os.environ, {"GITHUB_TOKEN_FILE": str(secret)}):
+        os.environ.pop("GITHUB_TOKEN", None)
+        config = load_config(path)
+        assert config.github_token_resolved == "file-token"
+        secret.write_text("rotated-token\n", encoding="utf-8")
+        assert config.github_token_resolved == "rotated-token"
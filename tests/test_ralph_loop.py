@@ -59,6 +59,7 @@ def test_ralph_loop_returns_success_when_pr_report_written(tmp_path: Path) -> No
     adapter.create_branch.side_effect = None
     adapter.create_pr.side_effect = None
     adapter.set_issue_labels.side_effect = None
+    adapter.fetch_issue_bundle.return_value = (_issue(number=1), [])
 
     agent = MagicMock()
     agent.evaluate_sufficiency.return_value = type("R", (), {"sufficient": True, "clarification": ""})()
@@ -1,5 +1,6 @@
 """Unified tests for store (issue_store, pr_store, schemas)."""
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from coddy.services.store import (
     add_comment,
     create_issue,
     delete_comment,
+    iter_issues_by_status,
     list_issues_by_status,
     list_pending_plan,
     list_queued,
@@ -86,6 +88,13 @@ class TestIssueStore:
         (path / "13.yaml").write_text("null", encoding="utf-8")
         assert load_issue(tmp_path, 13) is None
 
+    def test_load_issue_non_mapping_yaml_returns_none(self, tmp_path: Path) -> None:
+        """load_issue returns None when the YAML document is not a mapping."""
+        issues_dir = tmp_path / ".coddy" / "issues"
+        issues_dir.mkdir(parents=True)
+        (issues_dir / "1.yaml").write_text("- just\n- a list\n", encoding="utf-8")
+        assert load_issue(tmp_path, 1) is None
+
     def test_load_issue_invalid_schema_returns_none(self, tmp_path: Path) -> None:
         """load_issue returns None when YAML does not match IssueFile schema
         (missing required)."""
@@ -233,6 +242,138 @@ class TestIssueStore:
             result = list_status(tmp_path, "pending_plan")
         assert len(result) == 0
 
+    def test_list_issues_by_status_skips_load_when_status_line_differs(self, tmp_path: Path) -> None:
+        """list_issues_by_status does not fully load files whose status line
+        does not match."""
+        create_issue(tmp_path, 1, "o/r", "A", "", "@u")
+        create_issue(tmp_path, 2, "o/r", "B", "", "@u")
+        set_issue_status(tmp_path, 2, "queued")
+        with patch("coddy.services.store.issue_store.load_issue", wraps=load_issue) as mock_load:
+            from coddy.services.store.issue_store import list_issues_by_status as list_status
+
+            result = list_status(tmp_path, "queued")
+        assert [n for n, _ in result] == [2]
+        mock_load.assert_called_once_with(tmp_path, 2)
+
+    def test_list_issues_by_status_parses_status_line_with_comment(self, tmp_path: Path) -> None:
+        """A hand-edited status line with a trailing comment is not trusted by
+        the peek; the full YAML load still finds the issue."""
+        from coddy.services.store.issue_store import _peek_status
+
+        create_issue(tmp_path, 3, "o/r", "C", "", "@u")
+        path = tmp_path / ".coddy" / "issues" / "3.yaml"
+        text = path.read_text(encoding="utf-8").replace("status: pending_plan", "status: queued  # retry")
+        path.write_text(text, encoding="utf-8")
+        assert _peek_status(path) is None
+        assert [n for n, _ in list_queued(tmp_path)] == [3]
+
+    def test_load_issue_unchanged_file_skips_parse_and_returns_copy(self, tmp_path: Path) -> None:
+        """load_issue serves an unchanged file from cache; callers get
+        independent copies."""
+        create_issue(tmp_path, 5, "o/r", "Cached", "", "@u")
+        with patch("coddy.services.store.issue_store._yaml_load") as mock_parse:
+            first = load_issue(tmp_path, 5)
+            second = load_issue(tmp_path, 5)
+        mock_parse.assert_not_called()
+        assert first is not None and second is not None
+        first.comments.append(IssueComment(name="@u", content="local", created_at=1, updated_at=1))
+        assert second.comments == []
+        assert load_issue(tmp_path, 5).comments == []
+
+    def test_load_issue_reloads_when_file_changes_on_disk(self, tmp_path: Path) -> None:
+        """load_issue re-parses a file modified outside the store."""
+        create_issue(tmp_path, 6, "o/r", "Old title", "", "@u")
+        assert load_issue(tmp_path, 6).title == "Old title"
+        path = tmp_path / ".coddy" / "issues" / "6.yaml"
+        path.write_text(path.read_text(encoding="utf-8").replace("Old title", "New title!"), encoding="utf-8")
+        assert load_issue(tmp_path, 6).title == "New title!"
+        path.unlink()
+        assert load_issue(tmp_path, 6) is None
+
+    def test_load_issue_sees_same_size_rewrite_within_one_mtime_tick(self, tmp_path: Path) -> None:
+        """A rewrite by another process with the same size and mtime (one tick)
+        is detected through the new inode of the replaced file."""
+        import os
+
+        create_issue(tmp_path, 8, "o/r", "T", "", "@u")
+        set_issue_status(tmp_path, 8, "queued")
+        assert load_issue(tmp_path, 8).status == "queued"
+        path = tmp_path / ".coddy" / "issues" / "8.yaml"
+        st = path.stat()
+        tmp = path.with_name("8.yaml.other")
+        tmp.write_text(path.read_text(encoding="utf-8").replace("status: queued", "status: closed"), encoding="utf-8")
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, path)
+        assert path.stat().st_size == st.st_size and path.stat().st_mtime_ns == st.st_mtime_ns
+        assert load_issue(tmp_path, 8).status == "closed"
+
+    def test_load_issue_after_save_matches_validated_file(self, tmp_path: Path) -> None:
+        """The write-through copy built without validation equals a validated
+        parse of the written file."""
+        import yaml
+
+        create_issue(tmp_path, 7, "o/r", "T", "D", "@u", assigned_at=5, assigned_to="@bot")
+        add_comment(tmp_path, 7, "@u", "hello", comment_id=11)
+        delete_comment(tmp_path, 7, 11, deleted_at=9)
+        cached = load_issue(tmp_path, 7)
+        raw = yaml.safe_load((tmp_path / ".coddy" / "issues" / "7.yaml").read_text(encoding="utf-8"))
+        assert cached == IssueFile.model_validate(raw)
+        assert isinstance(cached.comments[0], IssueComment)
+
+    def test_list_issues_by_status_uses_cached_status_for_unchanged_files(self, tmp_path: Path) -> None:
+        """Files already in the load cache are filtered without being
+        opened."""
+        create_issue(tmp_path, 1, "o/r", "A", "", "@u")
+        create_issue(tmp_path, 2, "o/r", "B", "", "@u")
+        set_issue_status(tmp_path, 2, "queued")
+        with patch("coddy.services.store.issue_store._peek_status") as mock_peek:
+            result = list_queued(tmp_path)
+        mock_peek.assert_not_called()
+        assert [n for n, _ in result] == [2]
+
+    def test_list_issues_by_status_reuses_listing_of_unchanged_dir(self, tmp_path: Path) -> None:
+        """An issues dir whose mtime did not change is not listed again; a
+        new file bumps the mtime and shows up."""
+        create_issue(tmp_path, 1, "o/r", "A", "", "@u")
+        issues_dir = tmp_path / ".coddy" / "issues"
+        old = issues_dir.stat().st_mtime - 60
+        os.utime(issues_dir, (old, old))
+        assert [n for n, _ in list_pending_plan(tmp_path)] == [1]
+        with patch("coddy.services.store.issue_store.os.scandir") as mock_scandir:
+            assert [n for n, _ in list_pending_plan(tmp_path)] == [1]
+        mock_scandir.assert_not_called()
+        create_issue(tmp_path, 2, "o/r", "B", "", "@u")
+        assert sorted(n for n, _ in list_pending_plan(tmp_path)) == [1, 2]
+
+    def test_iter_issues_by_status_stops_loading_after_first_match(self, tmp_path: Path) -> None:
+        """iter_issues_by_status is lazy: next() loads only the first
+        match."""
+        for n in (1, 2, 3):
+            create_issue(tmp_path, n, "o/r", f"T{n}", "", "@u")
+            set_issue_status(tmp_path, n, "queued")
+        with patch("coddy.services.store.issue_store.load_issue", wraps=load_issue) as mock_load:
+            first = next(iter_issues_by_status(tmp_path, "queued"))
+        assert first[1].status == "queued"
+        mock_load.assert_called_once()
+
+    def test_list_issues_by_status_loads_candidates_on_io_pool(self, tmp_path: Path) -> None:
+        """Several candidate files are loaded through the shared pool."""
+        from coddy.services.store import issue_store
+
+        for n in (1, 2, 3):
+            create_issue(tmp_path, n, "o/r", f"T{n}", "", "@u")
+        with patch.object(issue_store, "_IO_POOL", wraps=issue_store._IO_POOL) as pool:
+            result = list_pending_plan(tmp_path)
+        pool.map.assert_called_once()
+        assert [n for n, _ in result] == [1, 2, 3]
+
+    def test_list_issues_by_status_orders_by_issue_id(self, tmp_path: Path) -> None:
+        """Issues are listed in numeric id order (10 after 2)."""
+        for n in (10, 2, 1):
+            create_issue(tmp_path, n, "o/r", f"T{n}", "", "@u")
+        assert [n for n, _ in list_pending_plan(tmp_path)] == [1, 2, 10]
+        assert next(iter_issues_by_status(tmp_path, "pending_plan"))[0] == 1
+
     def test_list_pending_plan_and_list_queued(self, tmp_path: Path) -> None:
         """list_pending_plan and list_queued filter by status."""
         create_issue(tmp_path, 3, "o/r", "X", "", "@u")
@@ -262,6 +403,25 @@ class TestIssueStore:
         assert loaded.title == "Manual"
         assert loaded.status == "queued"
 
+    def test_save_issue_replaces_file_atomically(self, tmp_path: Path) -> None:
+        """save_issue publishes via os.replace and leaves no temp files."""
+        create_issue(tmp_path, 8, "o/r", "T", "", "@u")
+        with patch("coddy.services.store._io.os.replace", wraps=os.replace) as mock_replace:
+            set_issue_status(tmp_path, 8, "queued")
+        mock_replace.assert_called_once()
+        assert sorted(p.name for p in (tmp_path / ".coddy" / "issues").iterdir()) == ["8.yaml"]
+        assert load_issue(tmp_path, 8).status == "queued"
+
+    def test_save_issue_skips_unchanged_content(self, tmp_path: Path) -> None:
+        """save_issue does not rewrite a file that already holds the same issue."""
+        issue = create_issue(tmp_path, 9, "o/r", "T", "", "@u", created_at=1, updated_at=1)
+        with patch("coddy.services.store.issue_store._atomic_write") as mock_write:
+            save_issue(tmp_path, 9, issue)
+            mock_write.assert_not_called()
+            issue.status = "queued"
+            save_issue(tmp_path, 9, issue)
+            mock_write.assert_called_once()
+
     def test_save_issue_with_none_issue_id_uses_param(self, tmp_path: Path) -> None:
         """save_issue adds issue_id to payload when issue.issue_id is None."""
         issue = IssueFile(
@@ -381,6 +541,27 @@ class TestPRStore:
         assert pr is not None
         assert pr.status == "merged"
 
+    def test_load_pr_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        """load_pr parses an unchanged file once and re-parses after an
+        external edit."""
+        set_pr_status(tmp_path, 13, "open", repo="o/r")
+        with patch("coddy.services.store.pr_store._yaml_load") as mock_load:
+            assert load_pr(tmp_path, 13).status == "open"
+        mock_load.assert_not_called()
+        path = tmp_path / ".coddy" / "prs" / "13.yaml"
+        path.write_text(path.read_text(encoding="utf-8").replace("open", "merged"), encoding="utf-8")
+        assert load_pr(tmp_path, 13).status == "merged"
+
+    def test_set_pr_status_skips_unchanged_record(self, tmp_path: Path) -> None:
+        """set_pr_status does not rewrite a PR that already has the status."""
+        set_pr_status(tmp_path, 14, "closed", repo="o/r", issue_number=3)
+        with patch("coddy.services.store.pr_store.save_pr") as mock_save:
+            set_pr_status(tmp_path, 14, "closed", repo="o/r", issue_number=3)
+            set_pr_status(tmp_path, 14, "closed")
+            mock_save.assert_not_called()
+            set_pr_status(tmp_path, 14, "closed", issue_number=4)
+            mock_save.assert_called_once()
+
     def test_set_pr_status_updates_repo_and_issue_id(self, tmp_path: Path) -> None:
         """set_pr_status updates repo and issue_id when passed on existing
         PR."""
@@ -9,6 +9,15 @@ from coddy.observer.webhook.handlers import handle_github_event
 from coddy.services.store import IssueFile, load_issue
 
 
+@pytest.fixture(autouse=True)
+def _clear_handler_caches() -> None:
+    """Issues and adapters cached by one test must not be served to the next."""
+    from coddy.observer.webhook import handlers
+
+    handlers._issue_cache.clear()
+    handlers._get_adapter.cache_clear()
+
+
 @pytest.fixture
 def config_pr_merged() -> "object":
     """Config with github platform and default_branch."""
@@ -22,22 +31,20 @@ def config_pr_merged() -> "object":
 
 
 def test_handle_pr_merged_pulls_and_exits(config_pr_merged: "object") -> None:
-    """On pull_request closed+merged, run_git_pull is called and
-    sys.exit(0)."""
+    """On pull_request closed+merged, run_git_pull runs and a restart is
+    requested."""
     payload = {
         "action": "closed",
         "pull_request": {"merged": True, "number": 1},
         "repository": {"full_name": "owner/repo"},
     }
     with patch("coddy.observer.webhook.handlers.run_git_pull", create=True) as mock_pull:
-        with patch("coddy.observer.webhook.handlers.sys.exit") as mock_exit:
-            mock_exit.side_effect = SystemExit(0)
-            with pytest.raises(SystemExit, match="0"):
-                handle_github_event(config_pr_merged, "pull_request", payload)
+        with patch("coddy.observer.webhook.handlers._request_restart") as mock_restart:
+            handle_github_event(config_pr_merged, "pull_request", payload)
     mock_pull.assert_called_once()
     call_kw = mock_pull.call_args[1]
     assert call_kw["log"] is not None
-    mock_exit.assert_called_once_with(0)
+    mock_restart.assert_called_once_with()
 
 
 def test_handle_pr_merged_ignores_when_not_merged(config_pr_merged: "object") -> None:
@@ -48,10 +55,10 @@ def test_handle_pr_merged_ignores_when_not_merged(config_pr_merged: "object") ->
         "repository": {"full_name": "owner/repo"},
     }
     with patch("coddy.observer.webhook.handlers.run_git_pull", create=True) as mock_pull:
-        with patch("coddy.observer.webhook.handlers.sys.exit") as mock_exit:
+        with patch("coddy.observer.webhook.handlers._request_restart") as mock_restart:
             handle_github_event(config_pr_merged, "pull_request", payload)
     mock_pull.assert_not_called()
-    mock_exit.assert_not_called()
+    mock_restart.assert_not_called()
 
 
 def test_handle_pr_merged_ignores_other_repo(config_pr_merged: "object") -> None:
@@ -62,10 +69,10 @@ def test_handle_pr_merged_ignores_other_repo(config_pr_merged: "object") -> None
         "repository": {"full_name": "other/repo"},
     }
     with patch("coddy.observer.webhook.handlers.run_git_pull", create=True) as mock_pull:
-        with patch("coddy.observer.webhook.handlers.sys.exit") as mock_exit:
+        with patch("coddy.observer.webhook.handlers._request_restart") as mock_restart:
             handle_github_event(config_pr_merged, "pull_request", payload)
     mock_pull.assert_not_called()
-    mock_exit.assert_not_called()
+    mock_restart.assert_not_called()
 
 
 def test_handle_pr_merged_uses_repo_dir_when_passed(config_pr_merged: "object") -> None:
@@ -77,20 +84,19 @@ def test_handle_pr_merged_uses_repo_dir_when_passed(config_pr_merged: "object")
     }
     custom_dir = Path("/tmp/bot-repo")
     with patch("coddy.observer.webhook.handlers.run_git_pull", create=True) as mock_pull:
-        with patch("coddy.observer.webhook.handlers.sys.exit", side_effect=SystemExit(0)):
-            with pytest.raises(SystemExit):
-                handle_github_event(
-                    config_pr_merged,
-                    "pull_request",
-                    payload,
-                    repo_dir=custom_dir,
-                )
+        with patch("coddy.observer.webhook.handlers._request_restart"):
+            handle_github_event(
+                config_pr_merged,
+                "pull_request",
+                payload,
+                repo_dir=custom_dir,
+            )
     mock_pull.assert_called_once()
     assert mock_pull.call_args[1]["repo_dir"] == custom_dir
 
 
 def test_handle_pr_merged_no_exit_on_pull_failure(config_pr_merged: "object") -> None:
-    """When run_git_pull raises, we do not call sys.exit."""
+    """When run_git_pull raises, no restart is requested."""
     from coddy.services.git import GitRunnerError
 
     payload = {
@@ -99,9 +105,9 @@ def test_handle_pr_merged_no_exit_on_pull_failure(config_pr_merged: "object") ->
         "repository": {"full_name": "owner/repo"},
     }
     with patch("coddy.observer.webhook.handlers.run_git_pull", create=True, side_effect=GitRunnerError("pull failed")):
-        with patch("coddy.observer.webhook.handlers.sys.exit") as mock_exit:
+        with patch("coddy.observer.webhook.handlers._request_restart") as mock_restart:
             handle_github_event(config_pr_merged, "pull_request", payload)
-    mock_exit.assert_not_called()
+    mock_restart.assert_not_called()
 
 
 def test_handle_issues_assigned_creates_issue_file_when_bot_in_assignees(tmp_path: Path) -> None:
@@ -125,9 +131,14 @@ def test_handle_issues_assigned_creates_issue_file_when_bot_in_assignees(tmp_pat
         },
         "repository": {"full_name": "owner/repo"},
     }
-    with patch("coddy.observer.webhook.handlers.create_issue") as mock_create:
-        handle_github_event(config, "issues", payload, repo_dir=tmp_path)
+    from coddy.services.store import create_issue
+
+    with patch("coddy.observer.webhook.handlers.create_issue", wraps=create_issue) as mock_create:
+        with patch("coddy.observer.webhook.handlers.save_issue") as mock_save:
+            handle_github_event(config, "issues", payload, repo_dir=tmp_path)
     mock_create.assert_called_once()
+    mock_save.assert_not_called()
+    assert load_issue(tmp_path, 42).assigned_to == "coddybot"
     call_args = mock_create.call_args[0]
     assert call_args[0] == tmp_path
     assert call_args[1] == 42
@@ -218,7 +229,8 @@ def test_handle_issue_comment_ignores_when_not_waiting_confirmation(tmp_path: Pa
 
 
 def test_handle_issue_comment_ignores_bot_comment(tmp_path: Path) -> None:
-    """On issue_comment from bot user, on_user_confirmed is not called."""
+    """On issue_comment from bot user, on_user_confirmed is not called and
+    the issue store is not read."""
     config = type("Config", (), {})()
     config.bot = type("Bot", (), {})()
     config.bot.repository = "owner/repo"
@@ -239,10 +251,11 @@ def test_handle_issue_comment_ignores_bot_comment(tmp_path: Path) -> None:
         status="waiting_confirmation",
         title="T",
     )
-    with patch("coddy.observer.webhook.handlers.load_issue", return_value=issue_file):
+    with patch("coddy.observer.webhook.handlers.load_issue", return_value=issue_file) as mock_load:
         with patch("coddy.observer.webhook.handlers.on_user_confirmed") as mock_confirm:
             handle_github_event(config, "issue_comment", payload, repo_dir=tmp_path)
     mock_confirm.assert_not_called()
+    mock_load.assert_not_called()
 
 
 def test_handle_issue_comment_appends_to_store_even_when_closed(tmp_path: Path) -> None:
@@ -518,3 +531,95 @@ def test_webhook_issue_comment_affirmative_sets_queued(tmp_path: Path) -> None:
     assert queued[0][1].repo == "owner/repo"
 
     mock_adapter.create_comment.assert_called_once()
+
+
+def test_handle_github_event_skips_duplicate_delivery(tmp_path: Path) -> None:
+    """A redelivered X-GitHub-Delivery id is handled only once."""
+    from coddy.observer.webhook import handlers
+
+    config = _issues_assigned_config(tmp_path)
+    payload = {"action": "opened", "issue": {"number": 1}, "repository": {"full_name": "owner/repo"}}
+    mock_issues = MagicMock()
+    with patch.dict(handlers._DISPATCH, {"issues": mock_issues}):
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="dup-delivery-1")
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="dup-delivery-1")
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="dup-delivery-2")
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path)
+    assert mock_issues.call_count == 3
+
+
+def test_delivery_in_memory_is_recorded_only_after_handling() -> None:
+    """A delivery id checked but never marked handled is not a duplicate."""
+    from coddy.observer.webhook import handlers
+
+    handlers._seen_deliveries.clear()
+    assert not handlers._is_duplicate_delivery("mem-delivery-1")
+    assert not handlers._is_duplicate_delivery("mem-delivery-1")
+    handlers._mark_delivery_handled("mem-delivery-1")
+    assert handlers._is_duplicate_delivery("mem-delivery-1")
+
+
+def test_handle_github_event_reprocesses_redelivery_after_handler_error(tmp_path: Path) -> None:
+    """A delivery whose handler raised is not recorded (in memory or in the
+    workspace table), so GitHub's redelivery is handled again, also after a
+    restart."""
+    from coddy.observer.webhook import handlers
+
+    config = _issues_assigned_config(tmp_path)
+    payload = {"action": "opened", "issue": {"number": 1}, "repository": {"full_name": "owner/repo"}}
+    mock_issues = MagicMock(side_effect=[RuntimeError("GitHub API error"), None, None])
+    with patch.dict(handlers._DISPATCH, {"issues": mock_issues}):
+        with pytest.raises(RuntimeError):
+            handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="failed-delivery-1")
+        handlers._seen_deliveries.clear()
+        handlers._delivery_dbs.pop(str(tmp_path)).close()
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="failed-delivery-1")
+        handlers._seen_deliveries.clear()
+        handlers._delivery_dbs.pop(str(tmp_path)).close()
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="failed-delivery-1")
+    assert mock_issues.call_count == 2
+
+
+def test_cached_get_issue_reuses_recent_fetch() -> None:
+    """Repeated lookups of one issue within the TTL make a single API call."""
+    from coddy.observer.webhook.handlers import _cached_get_issue, _forget_issue
+
+    adapter = MagicMock()
+    adapter.get_issue.side_effect = lambda repo, number: MagicMock(number=number)
+    first = _cached_get_issue(adapter, "o/r", 7)
+    assert _cached_get_issue(adapter, "o/r", 7) is first
+    adapter.get_issue.assert_called_once_with("o/r", 7)
+    _forget_issue("o/r", 7)
+    _cached_get_issue(adapter, "o/r", 7)
+    assert adapter.get_issue.call_count == 2
+
+
+def test_handle_github_event_drops_foreign_repository_before_dispatch(tmp_path: Path) -> None:
+    """Events for another repository never reach the per-event handlers."""
+    from coddy.observer.webhook import handlers
+
+    config = _issues_assigned_config(tmp_path)
+    payload = {"action": "opened", "issue": {"number": 1}, "repository": {"full_name": "other/repo"}}
+    mock_issues, mock_comment = MagicMock(), MagicMock()
+    with patch.dict(handlers._DISPATCH, {"issues": mock_issues, "issue_comment": mock_comment}):
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path)
+        handle_github_event(config, "issue_comment", payload, repo_dir=tmp_path)
+    mock_issues.assert_not_called()
+    mock_comment.assert_not_called()
+
+
+def test_handle_github_event_dedup_survives_restart(tmp_path: Path) -> None:
+    """Delivery ids are persisted in the workspace, so a restarted observer
+    (empty in-memory cache, new connection) still skips a redelivery."""
+    from coddy.observer.webhook import handlers
+
+    config = _issues_assigned_config(tmp_path)
+    payload = {"action": "opened", "issue": {"number": 1}, "repository": {"full_name": "owner/repo"}}
+    mock_issues = MagicMock()
+    with patch.dict(handlers._DISPATCH, {"issues": mock_issues}):
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="restart-delivery-1")
+        handlers._seen_deliveries.clear()
+        handlers._delivery_dbs.pop(str(tmp_path)).close()
+        handle_github_event(config, "issues", payload, repo_dir=tmp_path, delivery_id="restart-delivery-1")
+    mock_issues.assert_called_once()
+    assert (tmp_path / handlers.DELIVERIES_DB).is_file()
@@ -0,0 +1,121 @@
+"""Tests for the webhook HTTP server."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.request import Request, urlopen
+
+import pytest
+
+from coddy.observer.webhook import handlers
+from coddy.observer.webhook import server as webhook_server
+
+
+def test_github_webhook_is_acknowledged_before_event_is_handled() -> None:
+    """POST to the webhook path returns 200 while the event is still being
+    handled on the executor."""
+    config = type("Config", (), {})()
+    config.github = type("GitHub", (), {"webhook_path": "/webhook/github"})()
+    release = threading.Event()
+    handled = threading.Event()
+
+    def slow_handle(*args: object, **kwargs: object) -> None:
+        release.wait(5)
+        handled.set()
+
+    webhook_server.WebhookHandler.config = config
+    webhook_server.WebhookHandler.executor = ThreadPoolExecutor(max_workers=1)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), webhook_server.WebhookHandler)
+    serve = threading.Thread(target=httpd.serve_forever, daemon=True)
+    serve.start()
+    try:
+        with patch.object(webhook_server, "handle_github_event", side_effect=slow_handle) as mock_handle:
+            req = Request(
+                f"http://127.0.0.1:{httpd.server_address[1]}/webhook/github",
+                data=json.dumps({"action": "opened"}).encode(),
+                headers={"Content-Type": "application/json", "X-GitHub-Event": "issues", "X-GitHub-Delivery": "d-1"},
+            )
+            with urlopen(req, timeout=5) as resp:
+                assert resp.status == 200
+                assert json.loads(resp.read()) == {"received": True}
+            assert not handled.is_set()
+            release.set()
+            assert handled.wait(5)
+        mock_handle.assert_called_once_with(config, "issues", {"action": "opened"}, delivery_id="d-1")
+    finally:
+        release.set()
+        httpd.shutdown()
+        httpd.server_close()
+        webhook_server.WebhookHandler.executor.shutdown(wait=True)
+
+
+def test_delivery_key_falls_back_to_body_hash() -> None:
+    """Without X-GitHub-Delivery, identical event + body map to the same key."""
+    key = webhook_server._delivery_key(None, "issues", b'{"action": "opened"}')
+    assert key.startswith("body:")
+    assert webhook_server._delivery_key("", "issues", b'{"action": "opened"}') == key
+    assert webhook_server._delivery_key(None, "issue_comment", b'{"action": "opened"}') != key
+    assert webhook_server._delivery_key(None, "issues", b'{"action": "closed"}') != key
+    assert webhook_server._delivery_key("d-1", "issues", b'{"action": "opened"}') == "d-1"
+
+
+def test_run_webhook_server_drains_queued_events_on_stop() -> None:
+    """When serve_forever is interrupted (restart, Ctrl-C), events already
+    acknowledged and still queued are handled before the server returns."""
+    config = type("Config", (), {})()
+    config.webhook = type("Webhook", (), {"host": "127.0.0.1", "port": 0})()
+    handled: list[str] = []
+    started = threading.Event()
+
+    def slow_handle(config: object, event: str, payload: dict, delivery_id: str | None = None) -> None:
+        started.set()
+        threading.Event().wait(0.2)
+        handled.append(delivery_id or "")
+
+    def serve_then_stop() -> None:
+        executor = webhook_server.WebhookHandler.executor
+        executor.submit(webhook_server._handle_event, config, "issues", {}, "d-1")
+        executor.submit(webhook_server._handle_event, config, "issues", {}, "d-2")
+        started.wait(5)
+        raise KeyboardInterrupt
+
+    with patch.object(webhook_server, "ThreadingHTTPServer") as mock_server_cls:
+        mock_server_cls.return_value.serve_forever.side_effect = serve_then_stop
+        with patch.object(webhook_server, "handle_github_event", side_effect=slow_handle):
+            with pytest.raises(KeyboardInterrupt):
+                webhook_server.run_webhook_server(config)
+    mock_server_cls.return_value.server_close.assert_called_once()
+    assert handled == ["d-1", "d-2"]
+
+
+def test_restart_request_stops_server_after_queued_events() -> None:
+    """An event that requests a restart stops serving; events queued behind it
+    are still handled and run_webhook_server returns normally."""
+    config = type("Config", (), {})()
+    config.webhook = type("Webhook", (), {"host": "127.0.0.1", "port": 0})()
+    handled: list[str] = []
+    stopped = threading.Event()
+
+    def handle(config: object, event: str, payload: dict, delivery_id: str | None = None) -> None:
+        handled.append(delivery_id or "")
+        if event == "pull_request":
+            handlers._request_restart()
+
+    def serve_until_shutdown() -> None:
+        executor = webhook_server.WebhookHandler.executor
+        executor.submit(webhook_server._handle_event, config, "pull_request", {}, "d-1")
+        executor.submit(webhook_server._handle_event, config, "issues", {}, "d-2")
+        assert stopped.wait(5)
+
+    try:
+        with patch.object(webhook_server, "ThreadingHTTPServer") as mock_server_cls:
+            mock_server_cls.return_value.serve_forever.side_effect = serve_until_shutdown
+            mock_server_cls.return_value.shutdown.side_effect = stopped.set
+            with patch.object(webhook_server, "handle_github_event", side_effect=handle):
+                webhook_server.run_webhook_server(config)
+        mock_server_cls.return_value.shutdown.assert_called()
+        assert handled == ["d-1", "d-2"]
+    finally:
+        handlers.restart_requested.clear()